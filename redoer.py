@@ -2,39 +2,140 @@
 
 # -----------------------------------------------------------------------------
 # redoer.py - This script implements a daemon process that detects
-#   "redo records" and processes them. There are 3 types of threads running:
+#   "redo records" and processes them. There are 2 types of threads running:
 #     1) A single thread that monitors and logs periodic status.
-#     2) A single thread that reads from Senzing's "redo list" and places on
-#        an internal queue.
-#     3) Multiple threads that read from the internal queue and process each
-#        Senzing redo record.
+#     2) Multiple threads that read Senzing redo records -- directly from
+#        the Senzing engine's "redo list" or from an external queue,
+#        depending on the subcommand -- and process each one.
+#   Broker I/O deliberately stays on these threads rather than an asyncio
+#   event loop: G2Engine calls release the GIL, so the worker threads already
+#   overlap broker round-trip latency with Senzing compute, and the Kafka
+#   client (librdkafka) batches sends asynchronously on its own background
+#   thread.  An event-loop rewrite would add aiokafka/aiobotocore/aio-pika
+#   dependencies without removing any blocking from the hot path.
 # -----------------------------------------------------------------------------
 
 # Import from standard library. https://docs.python.org/3/library/
 
 import argparse
+import atexit
+import concurrent.futures
 import datetime
 import functools
+import importlib
 import json
-import linecache
 import logging
+import logging.handlers
 import os
 import queue
-import re
+import random
 import signal
 import string
 import subprocess
 import sys
 import threading
 import time
-from urllib.parse import urlparse, urlunparse
+import traceback
+from urllib.parse import urlsplit, urlunparse
 
 # Import from https://pypi.org/
+#
+# The queue-backend packages are heavy imports (boto3 alone pulls in all
+# of botocore).  They are imported lazily by the load_*() functions below
+# so subcommands that do not talk to a broker never pay the cost.
 
-from azure.servicebus import ServiceBusClient, ServiceBusMessage
-import boto3
-import confluent_kafka
-import pika
+ServiceBusClient = None  # pylint: disable=invalid-name
+ServiceBusMessage = None  # pylint: disable=invalid-name
+boto3 = None  # pylint: disable=invalid-name
+confluent_kafka = None  # pylint: disable=invalid-name
+pika = None  # pylint: disable=invalid-name
+
+# orjson serializes dicts several times faster than stdlib json.
+# It is optional; stdlib json is the fallback.
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dump_json(dictionary, sort_keys=False):
+    ''' Serialize a dictionary to a compact JSON string,
+        using orjson when it is installed. '''
+    if orjson is not None:
+        return orjson.dumps(dictionary, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode()
+    return json.dumps(dictionary, sort_keys=sort_keys, separators=(',', ':'))
+
+
+def load_json(text):
+    ''' Parse a JSON document (str, bytes, or bytearray),
+        using orjson when it is installed. '''
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def load_azure_servicebus():
+    ''' Import azure.servicebus resources on first use. '''
+    global ServiceBusClient, ServiceBusMessage  # pylint: disable=global-statement
+    if ServiceBusClient is None:
+        servicebus = importlib.import_module("azure.servicebus")
+        ServiceBusClient = servicebus.ServiceBusClient
+        ServiceBusMessage = servicebus.ServiceBusMessage
+
+
+def load_boto3():
+    ''' Import boto3 on first use. '''
+    global boto3  # pylint: disable=global-statement
+    if boto3 is None:
+        boto3 = importlib.import_module("boto3")
+
+
+def load_confluent_kafka():
+    ''' Import confluent_kafka on first use. '''
+    global confluent_kafka  # pylint: disable=global-statement
+    if confluent_kafka is None:
+        confluent_kafka = importlib.import_module("confluent_kafka")
+
+
+def load_pika():
+    ''' Import pika on first use. '''
+    global pika  # pylint: disable=global-statement
+    if pika is None:
+        pika = importlib.import_module("pika")
+
+
+@functools.lru_cache(maxsize=None)
+def get_sqs_client(endpoint_url):
+    '''
+    Return a process-wide boto3 SQS client for the endpoint.  botocore
+    clients are thread-safe; sharing one with a larger connection pool
+    raises the cap on concurrent in-flight HTTPS requests, which
+    botocore otherwise limits to ten.  Callers must run load_boto3()
+    first.
+    '''
+
+    botocore_config = importlib.import_module("botocore.config")
+    return boto3.client(
+        "sqs",
+        endpoint_url=endpoint_url,
+        config=botocore_config.Config(
+            max_pool_connections=64,
+            retries={'max_attempts': 10, 'mode': 'adaptive'},
+        ),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def get_servicebus_client(connection_string):
+    '''
+    Return a process-wide ServiceBusClient for the connection string.
+    The client owns an AMQP connection; sharing one avoids a TLS + SASL
+    handshake per mixin instance.  Callers must run
+    load_azure_servicebus() first.
+    '''
+
+    return ServiceBusClient.from_connection_string(connection_string)
 
 # Determine "Major" version of Senzing SDK.
 
@@ -69,6 +170,11 @@ __updated__ = '2024-03-18'
 SENZING_PRODUCT_ID = "5010"  # See https://github.com/senzing-garage/knowledge-base/blob/main/lists/senzing-product-ids.md
 LOG_FORMAT = '%(asctime)s %(message)s'
 
+# Set in __main__ when log records are routed through a QueueListener;
+# exit paths that bypass atexit flush it explicitly.
+
+LOG_LISTENER = None  # pylint: disable=invalid-name
+
 # Working with bytes.
 
 KILOBYTES = 1024
@@ -76,10 +182,30 @@ MEGABYTES = 1024 * KILOBYTES
 GIGABYTES = 1024 * MEGABYTES
 
 # Lists from https://www.ietf.org/rfc/rfc1738.txt
-
-SAFE_CHARACTER_LIST = ['$', '-', '_', '.', '+', '!', '*', '(', ')', ',', '"'] + list(string.ascii_letters)
-UNSAFE_CHARACTER_LIST = ['"', '<', '>', '#', '%', '{', '}', '|', '\\', '^', '~', '[', ']', '`']
-RESERVED_CHARACTER_LIST = [';', ',', '/', '?', ':', '@', '=', '&']
+# The tuples preserve substitution order; the frozensets give O(1)
+# membership tests for character scans.
+
+SAFE_CHARACTER_LIST = ('$', '-', '_', '.', '+', '!', '*', '(', ')', ',', '"') + tuple(string.ascii_letters)
+UNSAFE_CHARACTER_LIST = ('"', '<', '>', '#', '%', '{', '}', '|', '\\', '^', '~', '[', ']', '`')
+RESERVED_CHARACTER_LIST = (';', ',', '/', '?', ':', '@', '=', '&')
+
+SAFE_CHARACTER_SET = frozenset(SAFE_CHARACTER_LIST)
+UNSAFE_CHARACTER_SET = frozenset(UNSAFE_CHARACTER_LIST)
+RESERVED_CHARACTER_SET = frozenset(RESERVED_CHARACTER_LIST)
+
+# Per-record statistics counters.  Each worker thread increments its own
+# private copy (see Thread subclasses); the monitor thread sums across
+# workers at report time, so the hot path never shares a cache line or
+# contends on a common dictionary slot.
+
+COUNTER_KEYS = (
+    'processed_redo_records',
+    'sent_to_failure_queue',
+    'sent_to_info_queue',
+    'sent_to_redo_queue',
+    'received_from_redo_queue',
+    'redo_records_from_senzing_engine',
+)
 
 # The "CONFIGURATION_LOCATOR" describes where configuration variables are in:
 # 1) Command line options, 2) Environment variables, 3) Configuration files, 4) Default values
@@ -150,11 +276,26 @@ CONFIGURATION_LOCATOR = {
         "env": "SENZING_DATABASE_URL",
         "cli": "database-url"
     },
+    "kafka_acks": {
+        "default": "1",
+        "env": "SENZING_KAFKA_ACKS",
+        "cli": "kafka-acks",
+    },
+    "kafka_batch_size": {
+        "default": 65536,
+        "env": "SENZING_KAFKA_BATCH_SIZE",
+        "cli": "kafka-batch-size",
+    },
     "kafka_bootstrap_server": {
         "default": "localhost:9092",
         "env": "SENZING_KAFKA_BOOTSTRAP_SERVER",
         "cli": "kafka-bootstrap-server",
     },
+    "kafka_compression": {
+        "default": "snappy",
+        "env": "SENZING_KAFKA_COMPRESSION",
+        "cli": "kafka-compression",
+    },
     "kafka_failure_bootstrap_server": {
         "default": None,
         "env": "SENZING_KAFKA_FAILURE_BOOTSTRAP_SERVER",
@@ -175,6 +316,11 @@ CONFIGURATION_LOCATOR = {
         "env": "SENZING_KAFKA_INFO_TOPIC",
         "cli": "kafka-info-topic"
     },
+    "kafka_linger_ms": {
+        "default": 100,
+        "env": "SENZING_KAFKA_LINGER_MS",
+        "cli": "kafka-linger-ms",
+    },
     "kafka_redo_bootstrap_server": {
         "default": None,
         "env": "SENZING_KAFKA_REDO_BOOTSTRAP_SERVER",
@@ -216,7 +362,7 @@ CONFIGURATION_LOCATOR = {
         "cli": "pstack-pid",
     },
     "queue_maxsize": {
-        "default": 10,
+        "default": 1000,
         "env": "SENZING_QUEUE_MAX_SIZE",
         "cli": "queue-max-size"
     },
@@ -371,7 +517,7 @@ CONFIGURATION_LOCATOR = {
         "cli": "rabbitmq-username",
     },
     "rabbitmq_virtual_host": {
-        "default": pika.ConnectionParameters.DEFAULT_VIRTUAL_HOST,
+        "default": "/",
         "env": "SENZING_RABBITMQ_VIRTUAL_HOST",
         "cli": "rabbitmq-virtual-host",
     },
@@ -429,11 +575,6 @@ CONFIGURATION_LOCATOR = {
         "env": "SENZING_SUPPORT_PATH",
         "cli": "support-path"
     },
-    "threads_per_read_process": {
-        "default": 1,
-        "env": "SENZING_THREADS_PER_READ_PROCESS",
-        "cli": "threads-per-read-process",
-    },
     "threads_per_process": {
         "default": 4,
         "env": "SENZING_THREADS_PER_PROCESS",
@@ -441,408 +582,461 @@ CONFIGURATION_LOCATOR = {
     }
 }
 
+# Flattened views of "CONFIGURATION_LOCATOR", precomputed once at import
+# so configuration resolution is a linear pass over tuples instead of
+# repeated nested-dictionary traversal.
+
+CONFIGURATION_DEFAULTS = tuple((key, value.get('default')) for key, value in CONFIGURATION_LOCATOR.items())
+CONFIGURATION_ENV_VARS = tuple((key, value['env']) for key, value in CONFIGURATION_LOCATOR.items() if value.get('env'))
+CONFIGURATION_CLI_TO_KEY = {value['cli']: key for key, value in CONFIGURATION_LOCATOR.items() if value.get('cli')}
+
+# Keys coerced after the configuration sources are merged, since
+# environment variables and CLI arguments arrive as strings.
+
+CONFIGURATION_BOOLEAN_KEYS = (
+    'debug',
+    'exit_on_thread_termination',
+    'rabbitmq_use_existing_entities',
+    'run_gdb',
+)
+CONFIGURATION_INTEGER_KEYS = (
+    'delay_in_seconds',
+    'expiration_warning_in_days',
+    'kafka_batch_size',
+    'kafka_linger_ms',
+    'log_license_period_in_seconds',
+    'monitoring_period_in_seconds',
+    'queue_maxsize',
+    'rabbitmq_heartbeat_in_seconds',
+    'rabbitmq_reconnect_delay_in_seconds',
+    'redo_sleep_time_in_seconds',
+    'redo_retry_sleep_time_in_seconds',
+    'redo_retry_limit',
+    'sleep_time_in_seconds',
+    'threads_per_process',
+)
+TRUTHY_VALUES = frozenset(['true', '1', 't', 'y', 'yes'])
+
 # Enumerate keys in 'CONFIGURATION_LOCATOR' that should not be printed to the log.
 
-KEYS_TO_REDACT = [
+KEYS_TO_REDACT = frozenset([
     "engine_configuration_json",
+    "g2_configuration_json",
     "g2_database_url_generic",
     "g2_database_url_specific"
-]
+])
 
 # -----------------------------------------------------------------------------
 # Define argument parser
 # -----------------------------------------------------------------------------
 
 
-def get_parser():
-    ''' Parse commandline arguments. '''
+# The "SUBCOMMANDS" and "ARGUMENT_ASPECTS" tables are built once at
+# module scope so repeated get_parser() calls do not re-create them.
 
-    subcommands = {
-        'redo': {
-            "help": 'Read Senzing redo records from Senzing SDK and send to G2Engine.process()',
-            "argument_aspects": ["engine"]
+SUBCOMMANDS = {
+    'redo': {
+        "help": 'Read Senzing redo records from Senzing SDK and send to G2Engine.process()',
+        "argument_aspects": ["engine"]
+    },
+    'redo-withinfo-kafka': {
+        "help": 'Read Senzing redo records from Senzing SDK, send to G2Engine.processWithInfo(), results sent to Kafka.',
+        "argument_aspects": ["engine", "threads", "monitoring", "kafka", "kafka-redo", "kafka-info", "kafka-failure"],
+    },
+    'redo-withinfo-rabbitmq': {
+        "help": 'Read Senzing redo records from Senzing SDK, send to G2Engine.processWithInfo(), results sent to RabbitMQ.',
+        "argument_aspects": ["engine", "threads", "monitoring", "rabbitmq", "rabbitmq-redo", "rabbitmq-info", "rabbitmq-failure"],
+    },
+    'redo-withinfo-sqs': {
+        "help": 'Read Senzing redo records from Senzing SDK, send to G2Engine.processWithInfo(), results sent to AWS SQS.',
+        "argument_aspects": ["engine", "threads", "monitoring", "sqs-redo", "sqs-info", "sqs-failure"],
+    },
+    'read-from-kafka': {
+        "help": 'Read Senzing redo records from Kafka and send to G2Engine.process()',
+        "argument_aspects": ["engine", "threads", "monitoring", "kafka", "kafka-redo"],
+    },
+    'read-from-kafka-withinfo': {
+        "help": 'Read Senzing redo records from Kafka and send to G2Engine.processWithInfo()',
+        "argument_aspects": ["engine", "threads", "monitoring", "kafka", "kafka-redo", "kafka-info", "kafka-failure"],
+    },
+    'read-from-rabbitmq': {
+        "help": 'Read Senzing redo records from RabbitMQ and send to G2Engine.process()',
+        "argument_aspects": ["engine", "threads", "monitoring", "rabbitmq", "rabbitmq-redo"],
+    },
+    'read-from-rabbitmq-withinfo': {
+        "help": 'Read Senzing redo records from RabbitMQ and send to G2Engine.processWithInfo()',
+        "argument_aspects": ["engine", "threads", "monitoring", "rabbitmq", "rabbitmq-redo", "rabbitmq-info", "rabbitmq-failure"],
+    },
+    'read-from-sqs': {
+        "help": 'Read Senzing redo records from AWS SQS and send to G2Engine.process()',
+        "argument_aspects": ["engine", "threads", "monitoring", "sqs-redo"],
+    },
+    'read-from-sqs-withinfo': {
+        "help": 'Read Senzing redo records from AWS SQS and send to G2Engine.processWithInfo()',
+        "argument_aspects": ["engine", "threads", "monitoring", "sqs-redo", "sqs-info", "sqs-failure"],
+    },
+    'write-to-azure-queue': {
+        "help": 'Read Senzing redo records from Senzing SDK and send to Azure Message Bus queue.',
+        "argument_aspects": ["engine", "threads", "monitoring", "azure-queue", "azure-queue-redo"],
+    },
+    'write-to-kafka': {
+        "help": 'Read Senzing redo records from Senzing SDK and send to Kafka.',
+        "argument_aspects": ["engine", "threads", "monitoring", "kafka", "kafka-redo"],
+    },
+    'write-to-rabbitmq': {
+        "help": 'Read Senzing redo records from Senzing SDK and send to RabbitMQ.',
+        "argument_aspects": ["engine", "threads", "monitoring", "rabbitmq", "rabbitmq-redo"],
+    },
+    'write-to-sqs': {
+        "help": 'Read Senzing redo records from Senzing SDK and send to AWS SQS.',
+        "argument_aspects": ["engine", "threads", "monitoring", "sqs-redo"],
+    },
+    'sleep': {
+        "help": 'Do nothing but sleep. For Docker testing.',
+        "arguments": {
+            "--sleep-time-in-seconds": {
+                "dest": "sleep_time_in_seconds",
+                "metavar": "SENZING_SLEEP_TIME_IN_SECONDS",
+                "help": "Sleep time in seconds. DEFAULT: 0 (infinite)"
+            },
         },
-        'redo-withinfo-kafka': {
-            "help": 'Read Senzing redo records from Senzing SDK, send to G2Engine.processWithInfo(), results sent to Kafka.',
-            "argument_aspects": ["engine", "threads", "monitoring", "kafka", "kafka-redo", "kafka-info", "kafka-failure"],
+    },
+    'version': {
+        "help": 'Print version of program.',
+    },
+    'docker-acceptance-test': {
+        "help": 'For Docker acceptance testing.',
+    },
+}
+
+# Define argument_aspects.
+
+ARGUMENT_ASPECTS = {
+    "azure-queue": {
+        "--azure-queue-connection-string": {
+            "dest": "azure_queue_connection_string",
+            "metavar": "SENZING_AZURE_QUEUE_CONNECTION_STRING",
+            "help": "Azure Queue connection string. Default: none"
         },
-        'redo-withinfo-rabbitmq': {
-            "help": 'Read Senzing redo records from Senzing SDK, send to G2Engine.processWithInfo(), results sent to RabbitMQ.',
-            "argument_aspects": ["engine", "threads", "monitoring", "rabbitmq", "rabbitmq-redo", "rabbitmq-info", "rabbitmq-failure"],
+        "--azure-queue-name": {
+            "dest": "azure_queue_name",
+            "metavar": "SENZING_AZURE_QUEUE_NAME",
+            "help": "Azure Queue name. Default: none"
         },
-        'redo-withinfo-sqs': {
-            "help": 'Read Senzing redo records from Senzing SDK, send to G2Engine.processWithInfo(), results sent to AWS SQS.',
-            "argument_aspects": ["engine", "threads", "monitoring", "sqs-redo", "sqs-info", "sqs-failure"],
+    },
+    "azure-failure-queue": {
+        "--azure-failure-connection-string": {
+            "dest": "azure_failure_connection_string",
+            "metavar": "SENZING_AZURE_FAILURE_CONNECTION_STRING",
+            "help": "Azure Queue connection string for failures. Default: none"
         },
-        'read-from-kafka': {
-            "help": 'Read Senzing redo records from Kafka and send to G2Engine.process()',
-            "argument_aspects": ["engine", "threads", "monitoring", "kafka", "kafka-redo"],
+        "--azure-failure-queue-name": {
+            "dest": "azure_failure_queue_name",
+            "metavar": "SENZING_FAILURE_AZURE_QUEUE_NAME",
+            "help": "Azure Queue name for failures. Default: none"
         },
-        'read-from-kafka-withinfo': {
-            "help": 'Read Senzing redo records from Kafka and send to G2Engine.processWithInfo()',
-            "argument_aspects": ["engine", "threads", "monitoring", "kafka", "kafka-redo", "kafka-info", "kafka-failure"],
+    },
+    "azure-info-queue": {
+        "--azure-info-connection-string": {
+            "dest": "azure_info_connection_string",
+            "metavar": "SENZING_AZURE_INFO_CONNECTION_STRING",
+            "help": "Azure Queue connection string for withInfo. Default: none"
         },
-        'read-from-rabbitmq': {
-            "help": 'Read Senzing redo records from RabbitMQ and send to G2Engine.process()',
-            "argument_aspects": ["engine", "threads", "monitoring", "rabbitmq", "rabbitmq-redo"],
+        "--azure-info-queue-name": {
+            "dest": "azure_info_queue_name",
+            "metavar": "SENZING_INFO_AZURE_QUEUE_NAME",
+            "help": "Azure Queue name for withInfo. Default: none"
         },
-        'read-from-rabbitmq-withinfo': {
-            "help": 'Read Senzing redo records from RabbitMQ and send to G2Engine.processWithInfo()',
-            "argument_aspects": ["engine", "threads", "monitoring", "rabbitmq", "rabbitmq-redo", "rabbitmq-info", "rabbitmq-failure"],
+    },
+    "engine": {
+        "--engine-configuration-json": {
+            "dest": "engine_configuration_json",
+            "metavar": "SENZING_ENGINE_CONFIGURATION_JSON",
+            "help": "Advanced Senzing engine configuration. Default: none"
         },
-        'read-from-sqs': {
-            "help": 'Read Senzing redo records from AWS SQS and send to G2Engine.process()',
-            "argument_aspects": ["engine", "threads", "monitoring", "sqs-redo"],
+        "--license-base64-encoded": {
+            "dest": "license_base64_encoded",
+            "metavar": "SENZING_LICENSE_BASE64_ENCODED",
+            "help": "Base64 encoding of a Senzing license. Default: none"
+        }
+    },
+    "kafka": {
+        "--kafka-acks": {
+            "dest": "kafka_acks",
+            "metavar": "SENZING_KAFKA_ACKS",
+            "help": "Kafka producer acks. Default: 1"
         },
-        'read-from-sqs-withinfo': {
-            "help": 'Read Senzing redo records from AWS SQS and send to G2Engine.processWithInfo()',
-            "argument_aspects": ["engine", "threads", "monitoring", "sqs-redo", "sqs-info", "sqs-failure"],
+        "--kafka-batch-size": {
+            "dest": "kafka_batch_size",
+            "metavar": "SENZING_KAFKA_BATCH_SIZE",
+            "help": "Kafka producer batch.size in bytes. Default: 65536"
         },
-        'write-to-azure-queue': {
-            "help": 'Read Senzing redo records from Senzing SDK and send to Azure Message Bus queue.',
-            "argument_aspects": ["engine", "threads", "monitoring", "azure-queue", "azure-queue-redo"],
+        "--kafka-compression": {
+            "dest": "kafka_compression",
+            "metavar": "SENZING_KAFKA_COMPRESSION",
+            "help": "Kafka producer compression.type. Default: snappy"
         },
-        'write-to-kafka': {
-            "help": 'Read Senzing redo records from Senzing SDK and send to Kafka.',
-            "argument_aspects": ["engine", "threads", "monitoring", "kafka", "kafka-redo"],
+        "--kafka-bootstrap-server": {
+            "dest": "kafka_bootstrap_server",
+            "metavar": "SENZING_KAFKA_BOOTSTRAP_SERVER",
+            "help": "Kafka bootstrap server. Default: localhost:9092"
         },
-        'write-to-rabbitmq': {
-            "help": 'Read Senzing redo records from Senzing SDK and send to RabbitMQ.',
-            "argument_aspects": ["engine", "threads", "monitoring", "rabbitmq", "rabbitmq-redo"],
+        "--kafka-linger-ms": {
+            "dest": "kafka_linger_ms",
+            "metavar": "SENZING_KAFKA_LINGER_MS",
+            "help": "Kafka producer linger.ms. Default: 100"
         },
-        'write-to-sqs': {
-            "help": 'Read Senzing redo records from Senzing SDK and send to AWS SQS.',
-            "argument_aspects": ["engine", "threads", "monitoring", "sqs-redo"],
+    },
+    "kafka-failure": {
+        "--kafka-failure-bootstrap-server": {
+            "dest": "kafka_failure_bootstrap_server",
+            "metavar": "SENZING_KAFKA_FAILURE_BOOTSTRAP_SERVER",
+            "help": "Kafka bootstrap server. Default: SENZING_KAFKA_BOOTSTRAP_SERVER"
         },
-        'sleep': {
-            "help": 'Do nothing but sleep. For Docker testing.',
-            "arguments": {
-                "--sleep-time-in-seconds": {
-                    "dest": "sleep_time_in_seconds",
-                    "metavar": "SENZING_SLEEP_TIME_IN_SECONDS",
-                    "help": "Sleep time in seconds. DEFAULT: 0 (infinite)"
-                },
-            },
+        "--kafka-failure-topic": {
+            "dest": "kafka_failure_topic",
+            "metavar": "SENZING_KAFKA_FAILURE_TOPIC",
+            "help": "Kafka topic for failures. Default: senzing-kafka-failure-topic"
         },
-        'version': {
-            "help": 'Print version of program.',
+    },
+    "kafka-info": {
+        "--kafka-info-bootstrap-server": {
+            "dest": "kafka_info_bootstrap_server",
+            "metavar": "SENZING_KAFKA_INFO_BOOTSTRAP_SERVER",
+            "help": "Kafka bootstrap server. Default: SENZING_KAFKA_BOOTSTRAP_SERVER"
         },
-        'docker-acceptance-test': {
-            "help": 'For Docker acceptance testing.',
+        "--kafka-info-topic": {
+            "dest": "kafka_info_topic",
+            "metavar": "SENZING_KAFKA_INFO_TOPIC",
+            "help": "Kafka topic for info. Default: senzing-kafka-info-topic"
         },
-    }
-
-    # Define argument_aspects.
-
-    argument_aspects = {
-        "azure-queue": {
-            "--azure-queue-connection-string": {
-                "dest": "azure_queue_connection_string",
-                "metavar": "SENZING_AZURE_QUEUE_CONNECTION_STRING",
-                "help": "Azure Queue connection string. Default: none"
-            },
-            "--azure-queue-name": {
-                "dest": "azure_queue_name",
-                "metavar": "SENZING_AZURE_QUEUE_NAME",
-                "help": "Azure Queue name. Default: none"
-            },
+    },
+    "kafka-redo": {
+        "--kafka-redo-bootstrap-server": {
+            "dest": "kafka_redo_bootstrap_server",
+            "metavar": "SENZING_KAFKA_REDO_BOOTSTRAP_SERVER",
+            "help": "Kafka bootstrap server. Default: SENZING_KAFKA_BOOTSTRAP_SERVER"
         },
-        "azure-failure-queue": {
-            "--azure-failure-connection-string": {
-                "dest": "azure_failure_connection_string",
-                "metavar": "SENZING_AZURE_FAILURE_CONNECTION_STRING",
-                "help": "Azure Queue connection string for failures. Default: none"
-            },
-            "--azure-failure-queue-name": {
-                "dest": "azure_failure_queue_name",
-                "metavar": "SENZING_FAILURE_AZURE_QUEUE_NAME",
-                "help": "Azure Queue name for failures. Default: none"
-            },
+        "--kafka-redo-group": {
+            "dest": "kafka_redo_group",
+            "metavar": "SENZING_KAFKA_REDO_GROUP",
+            "help": "Kafka group. Default: senzing-kafka-redo-group"
         },
-        "azure-info-queue": {
-            "--azure-info-connection-string": {
-                "dest": "azure_info_connection_string",
-                "metavar": "SENZING_AZURE_INFO_CONNECTION_STRING",
-                "help": "Azure Queue connection string for withInfo. Default: none"
-            },
-            "--azure-info-queue-name": {
-                "dest": "azure_info_queue_name",
-                "metavar": "SENZING_INFO_AZURE_QUEUE_NAME",
-                "help": "Azure Queue name for withInfo. Default: none"
-            },
+        "--kafka-redo-topic": {
+            "dest": "kafka_redo_topic",
+            "metavar": "SENZING_KAFKA_REDO_TOPIC",
+            "help": "Kafka topic. Default: senzing-kafka-redo-topic"
         },
-        "engine": {
-            "--engine-configuration-json": {
-                "dest": "engine_configuration_json",
-                "metavar": "SENZING_ENGINE_CONFIGURATION_JSON",
-                "help": "Advanced Senzing engine configuration. Default: none"
-            },
-            "--license-base64-encoded": {
-                "dest": "license_base64_encoded",
-                "metavar": "SENZING_LICENSE_BASE64_ENCODED",
-                "help": "Base64 encoding of a Senzing license. Default: none"
-            }
+    },
+    "monitoring": {
+        "--monitoring-period-in-seconds": {
+            "dest": "monitoring_period_in_seconds",
+            "metavar": "SENZING_MONITORING_PERIOD_IN_SECONDS",
+            "help": "Period, in seconds, between monitoring reports. Default: 600"
         },
-        "kafka": {
-            "--kafka-bootstrap-server": {
-                "dest": "kafka_bootstrap_server",
-                "metavar": "SENZING_KAFKA_BOOTSTRAP_SERVER",
-                "help": "Kafka bootstrap server. Default: localhost:9092"
-            },
+    },
+    "rabbitmq": {
+        "--rabbitmq-exchange": {
+            "dest": "rabbitmq_exchange",
+            "metavar": "SENZING_RABBITMQ_EXCHANGE",
+            "help": "RabbitMQ exchange. Default: SENZING_RABBITMQ_EXCHANGE"
         },
-        "kafka-failure": {
-            "--kafka-failure-bootstrap-server": {
-                "dest": "kafka_failure_bootstrap_server",
-                "metavar": "SENZING_KAFKA_FAILURE_BOOTSTRAP_SERVER",
-                "help": "Kafka bootstrap server. Default: SENZING_KAFKA_BOOTSTRAP_SERVER"
-            },
-            "--kafka-failure-topic": {
-                "dest": "kafka_failure_topic",
-                "metavar": "SENZING_KAFKA_FAILURE_TOPIC",
-                "help": "Kafka topic for failures. Default: senzing-kafka-failure-topic"
-            },
+        "--rabbitmq-heartbeat-in-seconds": {
+            "dest": "rabbitmq_heartbeat_in_seconds",
+            "metavar": "SENZING_RABBITMQ_HEARTBEAT_IN_SECONDS",
+            "help": "RabbitMQ heartbeat. Default: 60"
         },
-        "kafka-info": {
-            "--kafka-info-bootstrap-server": {
-                "dest": "kafka_info_bootstrap_server",
-                "metavar": "SENZING_KAFKA_INFO_BOOTSTRAP_SERVER",
-                "help": "Kafka bootstrap server. Default: SENZING_KAFKA_BOOTSTRAP_SERVER"
-            },
-            "--kafka-info-topic": {
-                "dest": "kafka_info_topic",
-                "metavar": "SENZING_KAFKA_INFO_TOPIC",
-                "help": "Kafka topic for info. Default: senzing-kafka-info-topic"
-            },
+        "--rabbitmq-host": {
+            "dest": "rabbitmq_host",
+            "metavar": "SENZING_RABBITMQ_HOST",
+            "help": "RabbitMQ host. Default: localhost:5672"
         },
-        "kafka-redo": {
-            "--kafka-redo-bootstrap-server": {
-                "dest": "kafka_redo_bootstrap_server",
-                "metavar": "SENZING_KAFKA_REDO_BOOTSTRAP_SERVER",
-                "help": "Kafka bootstrap server. Default: SENZING_KAFKA_BOOTSTRAP_SERVER"
-            },
-            "--kafka-redo-group": {
-                "dest": "kafka_redo_group",
-                "metavar": "SENZING_KAFKA_REDO_GROUP",
-                "help": "Kafka group. Default: senzing-kafka-redo-group"
-            },
-            "--kafka-redo-topic": {
-                "dest": "kafka_redo_topic",
-                "metavar": "SENZING_KAFKA_REDO_TOPIC",
-                "help": "Kafka topic. Default: senzing-kafka-redo-topic"
-            },
+        "--rabbitmq-password": {
+            "dest": "rabbitmq_password",
+            "metavar": "SENZING_RABBITMQ_PASSWORD",
+            "help": "RabbitMQ password. Default: bitnami"
         },
-        "monitoring": {
-            "--monitoring-period-in-seconds": {
-                "dest": "monitoring_period_in_seconds",
-                "metavar": "SENZING_MONITORING_PERIOD_IN_SECONDS",
-                "help": "Period, in seconds, between monitoring reports. Default: 600"
-            },
+        "--rabbitmq-reconnect-delay-in-seconds": {
+            "dest": "rabbitmq_reconnect_delay_in_seconds",
+            "metavar": "SENZING_RABBITMQ_RECONNECT_DELAY_IN_SECONDS",
+            "help": "The time (in seconds) to wait between attempts to reconnect to the RabbitMQ broker. Default: 60"
         },
-        "rabbitmq": {
-            "--rabbitmq-exchange": {
-                "dest": "rabbitmq_exchange",
-                "metavar": "SENZING_RABBITMQ_EXCHANGE",
-                "help": "RabbitMQ exchange. Default: SENZING_RABBITMQ_EXCHANGE"
-            },
-            "--rabbitmq-heartbeat-in-seconds": {
-                "dest": "rabbitmq_heartbeat_in_seconds",
-                "metavar": "SENZING_RABBITMQ_HEARTBEAT_IN_SECONDS",
-                "help": "RabbitMQ heartbeat. Default: 60"
-            },
-            "--rabbitmq-host": {
-                "dest": "rabbitmq_host",
-                "metavar": "SENZING_RABBITMQ_HOST",
-                "help": "RabbitMQ host. Default: localhost:5672"
-            },
-            "--rabbitmq-password": {
-                "dest": "rabbitmq_password",
-                "metavar": "SENZING_RABBITMQ_PASSWORD",
-                "help": "RabbitMQ password. Default: bitnami"
-            },
-            "--rabbitmq-reconnect-delay-in-seconds": {
-                "dest": "rabbitmq_reconnect_delay_in_seconds",
-                "metavar": "SENZING_RABBITMQ_RECONNECT_DELAY_IN_SECONDS",
-                "help": "The time (in seconds) to wait between attempts to reconnect to the RabbitMQ broker. Default: 60"
-            },
-            "--rabbitmq-username": {
-                "dest": "rabbitmq_username",
-                "metavar": "SENZING_RABBITMQ_USERNAME",
-                "help": "RabbitMQ username. Default: user"
-            },
-            "--rabbitmq-virtual-host": {
-                "dest": "rabbitmq_virtual_host",
-                "metavar": "SENZING_RABBITMQ_VIRTUAL_HOST",
-                "help": "RabbitMQ virtual host. Default: The RabbitMQ defined default virtual host"
-            },
-            "--rabbitmq-use-existing-entities": {
-                "dest": "rabbitmq_use_existing_entities",
-                "metavar": "SENZING_RABBITMQ_USE_EXISTING_ENTITIES",
-                "help": "Connect to an existing exchange and queue using their settings. An error is thrown if the exchange or queue does not exist. If False, it will create the exchange and queue if they do not exist. If they exist, then it will attempt to connect, checking the settings match. Default: True"
-            },
+        "--rabbitmq-username": {
+            "dest": "rabbitmq_username",
+            "metavar": "SENZING_RABBITMQ_USERNAME",
+            "help": "RabbitMQ username. Default: user"
         },
-        "rabbitmq-failure": {
-            "--rabbitmq-failure-exchange": {
-                "dest": "rabbitmq_failure_exchange",
-                "metavar": "SENZING_RABBITMQ_FAILURE_EXCHANGE",
-                "help": "RabbitMQ exchange. Default: SENZING_RABBITMQ_EXCHANGE"
-            },
-            "--rabbitmq-failure-host": {
-                "dest": "rabbitmq_failure_host",
-                "metavar": "SENZING_RABBITMQ_FAILURE_HOST",
-                "help": "RabbitMQ host. Default: SENZING_RABBITMQ_HOST"
-            },
-            "--rabbitmq-failure-password": {
-                "dest": "rabbitmq_failure_password",
-                "metavar": "SENZING_RABBITMQ_FAILURE_PASSWORD",
-                "help": "RabbitMQ password. Default: SENZING_RABBITMQ_PASSWORD"
-            },
-            "--rabbitmq-failure-queue": {
-                "dest": "rabbitmq_failure_queue",
-                "metavar": "SENZING_RABBITMQ_FAILURE_QUEUE",
-                "help": "RabbitMQ queue for failures. Default: senzing-rabbitmq-failure-queue"
-            },
-            "--rabbitmq-failure-routing-key": {
-                "dest": "rabbitmq_failure_routing_key",
-                "metavar": "SENZING_RABBITMQ_FAILURE_ROUTING_KEY",
-                "help": "RabbitMQ routing key. Default: senzing.failure"
-            },
-            "--rabbitmq-failure-username": {
-                "dest": "rabbitmq_failure_username",
-                "metavar": "SENZING_RABBITMQ_FAILURE_USERNAME",
-                "help": "RabbitMQ username. Default: SENZING_RABBITMQ_USERNAME"
-            },
-            "--rabbitmq-failure-virtual-host": {
-                "dest": "rabbitmq_failure_virtual_host",
-                "metavar": "SENZING_RABBITMQ_FAILURE_VIRTUAL_HOST",
-                "help": "RabbitMQ virtual host. Default: SENZING_RABBITMQ_VIRTUAL_HOST"
-            },
+        "--rabbitmq-virtual-host": {
+            "dest": "rabbitmq_virtual_host",
+            "metavar": "SENZING_RABBITMQ_VIRTUAL_HOST",
+            "help": "RabbitMQ virtual host. Default: The RabbitMQ defined default virtual host"
         },
-        "rabbitmq-info": {
-            "--rabbitmq-info-exchange": {
-                "dest": "rabbitmq_info_exchange",
-                "metavar": "SENZING_RABBITMQ_INFO_EXCHANGE",
-                "help": "RabbitMQ exchange. Default: SENZING_RABBITMQ_EXCHANGE"
-            },
-            "--rabbitmq-info-host": {
-                "dest": "rabbitmq_info_host",
-                "metavar": "SENZING_RABBITMQ_INFO_HOST",
-                "help": "RabbitMQ host. Default: SENZING_RABBITMQ_HOST"
-            },
-            "--rabbitmq-info-password": {
-                "dest": "rabbitmq_info_password",
-                "metavar": "SENZING_RABBITMQ_INFO_PASSWORD",
-                "help": "RabbitMQ password. Default: SENZING_RABBITMQ_PASSWORD"
-            },
-            "--rabbitmq-info-queue": {
-                "dest": "rabbitmq_info_queue",
-                "metavar": "SENZING_RABBITMQ_INFO_QUEUE",
-                "help": "RabbitMQ queue for info. Default: senzing-rabbitmq-info-queue"
-            },
-            "--rabbitmq-info-routing-key": {
-                "dest": "rabbitmq_info_routing_key",
-                "metavar": "SENZING_RABBITMQ_INFO_ROUTING_KEY",
-                "help": "RabbitMQ routing key. Default: senzing.info"
-            },
-            "--rabbitmq-info-username": {
-                "dest": "rabbitmq_info_username",
-                "metavar": "SENZING_RABBITMQ_INFO_USERNAME",
-                "help": "RabbitMQ username. Default: SENZING_RABBITMQ_USERNAME"
-            },
-            "--rabbitmq-info-virtual-host": {
-                "dest": "rabbitmq_info_virtual_host",
-                "metavar": "SENZING_RABBITMQ_INFO_VIRTUAL_HOST",
-                "help": "RabbitMQ virtual host. Default: SENZING_RABBITMQ_VIRTUAL_HOST"
-            },
+        "--rabbitmq-use-existing-entities": {
+            "dest": "rabbitmq_use_existing_entities",
+            "metavar": "SENZING_RABBITMQ_USE_EXISTING_ENTITIES",
+            "help": "Connect to an existing exchange and queue using their settings. An error is thrown if the exchange or queue does not exist. If False, it will create the exchange and queue if they do not exist. If they exist, then it will attempt to connect, checking the settings match. Default: True"
         },
-        "rabbitmq-redo": {
-            "--rabbitmq-redo-exchange": {
-                "dest": "rabbitmq_redo_exchange",
-                "metavar": "SENZING_RABBITMQ_REDO_EXCHANGE",
-                "help": "RabbitMQ exchange. Default: SENZING_RABBITMQ_EXCHANGE"
-            },
-            "--rabbitmq-redo-host": {
-                "dest": "rabbitmq_redo_host",
-                "metavar": "SENZING_RABBITMQ_REDO_HOST",
-                "help": "RabbitMQ host. Default: SENZING_RABBITMQ_HOST"
-            },
-            "--rabbitmq-redo-password": {
-                "dest": "rabbitmq_redo_password",
-                "metavar": "SENZING_RABBITMQ_REDO_PASSWORD",
-                "help": "RabbitMQ password. Default: SENZING_RABBITMQ_PASSWORD"
-            },
-            "--rabbitmq-redo-queue": {
-                "dest": "rabbitmq_redo_queue",
-                "metavar": "SENZING_RABBITMQ_REDO_QUEUE",
-                "help": "RabbitMQ queue. Default: senzing-rabbitmq-redo-queue"
-            },
-            "--rabbitmq-redo-routing-key": {
-                "dest": "rabbitmq_redo_routing_key",
-                "metavar": "SENZING_RABBITMQ_REDO_ROUTING_KEY",
-                "help": "RabbitMQ routing key. Default: senzing.redo"
-            },
-            "--rabbitmq-redo-username": {
-                "dest": "rabbitmq_redo_username",
-                "metavar": "SENZING_RABBITMQ_REDO_USERNAME",
-                "help": "RabbitMQ username. Default: SENZING_RABBITMQ_USERNAME"
-            },
-            "--rabbitmq-redo-virtual-host": {
-                "dest": "rabbitmq_redo_virtual_host",
-                "metavar": "SENZING_RABBITMQ_redo_VIRTUAL_HOST",
-                "help": "RabbitMQ virtual host. Default: SENZING_RABBITMQ_VIRTUAL_HOST"
-            },
+    },
+    "rabbitmq-failure": {
+        "--rabbitmq-failure-exchange": {
+            "dest": "rabbitmq_failure_exchange",
+            "metavar": "SENZING_RABBITMQ_FAILURE_EXCHANGE",
+            "help": "RabbitMQ exchange. Default: SENZING_RABBITMQ_EXCHANGE"
         },
-        "sqs-failure": {
-            "--sqs-failure-queue-url": {
-                "dest": "sqs_failure_queue_url",
-                "metavar": "SENZING_SQS_FAILURE_QUEUE_URL",
-                "help": "AWS SQS failure URL. Default: none"
-            },
+        "--rabbitmq-failure-host": {
+            "dest": "rabbitmq_failure_host",
+            "metavar": "SENZING_RABBITMQ_FAILURE_HOST",
+            "help": "RabbitMQ host. Default: SENZING_RABBITMQ_HOST"
         },
-        "sqs-info": {
-            "--sqs-info-queue-url": {
-                "dest": "sqs_info_queue_url",
-                "metavar": "SENZING_SQS_INFO_QUEUE_URL",
-                "help": "AWS SQS info URL. Default: none"
-            },
+        "--rabbitmq-failure-password": {
+            "dest": "rabbitmq_failure_password",
+            "metavar": "SENZING_RABBITMQ_FAILURE_PASSWORD",
+            "help": "RabbitMQ password. Default: SENZING_RABBITMQ_PASSWORD"
         },
-        "sqs-redo": {
-            "--sqs-redo-queue-url": {
-                "dest": "sqs_redo_queue_url",
-                "metavar": "SENZING_SQS_REDO_QUEUE_URL",
-                "help": "AWS SQS redo URL. Default: none"
-            },
+        "--rabbitmq-failure-queue": {
+            "dest": "rabbitmq_failure_queue",
+            "metavar": "SENZING_RABBITMQ_FAILURE_QUEUE",
+            "help": "RabbitMQ queue for failures. Default: senzing-rabbitmq-failure-queue"
         },
-        "threads": {
-            "--threads-per-read-process": {
-                "dest": "threads_per_read_process",
-                "metavar": "SENZING_THREADS_PER_READ_PROCESS",
-                "help": "Number of threads per read process. Default: 1"
-            },
-            "--threads-per-process": {
-                "dest": "threads_per_process",
-                "metavar": "SENZING_THREADS_PER_PROCESS",
-                "help": "Number of threads per process. Default: 4"
-            }
+        "--rabbitmq-failure-routing-key": {
+            "dest": "rabbitmq_failure_routing_key",
+            "metavar": "SENZING_RABBITMQ_FAILURE_ROUTING_KEY",
+            "help": "RabbitMQ routing key. Default: senzing.failure"
         },
-    }
+        "--rabbitmq-failure-username": {
+            "dest": "rabbitmq_failure_username",
+            "metavar": "SENZING_RABBITMQ_FAILURE_USERNAME",
+            "help": "RabbitMQ username. Default: SENZING_RABBITMQ_USERNAME"
+        },
+        "--rabbitmq-failure-virtual-host": {
+            "dest": "rabbitmq_failure_virtual_host",
+            "metavar": "SENZING_RABBITMQ_FAILURE_VIRTUAL_HOST",
+            "help": "RabbitMQ virtual host. Default: SENZING_RABBITMQ_VIRTUAL_HOST"
+        },
+    },
+    "rabbitmq-info": {
+        "--rabbitmq-info-exchange": {
+            "dest": "rabbitmq_info_exchange",
+            "metavar": "SENZING_RABBITMQ_INFO_EXCHANGE",
+            "help": "RabbitMQ exchange. Default: SENZING_RABBITMQ_EXCHANGE"
+        },
+        "--rabbitmq-info-host": {
+            "dest": "rabbitmq_info_host",
+            "metavar": "SENZING_RABBITMQ_INFO_HOST",
+            "help": "RabbitMQ host. Default: SENZING_RABBITMQ_HOST"
+        },
+        "--rabbitmq-info-password": {
+            "dest": "rabbitmq_info_password",
+            "metavar": "SENZING_RABBITMQ_INFO_PASSWORD",
+            "help": "RabbitMQ password. Default: SENZING_RABBITMQ_PASSWORD"
+        },
+        "--rabbitmq-info-queue": {
+            "dest": "rabbitmq_info_queue",
+            "metavar": "SENZING_RABBITMQ_INFO_QUEUE",
+            "help": "RabbitMQ queue for info. Default: senzing-rabbitmq-info-queue"
+        },
+        "--rabbitmq-info-routing-key": {
+            "dest": "rabbitmq_info_routing_key",
+            "metavar": "SENZING_RABBITMQ_INFO_ROUTING_KEY",
+            "help": "RabbitMQ routing key. Default: senzing.info"
+        },
+        "--rabbitmq-info-username": {
+            "dest": "rabbitmq_info_username",
+            "metavar": "SENZING_RABBITMQ_INFO_USERNAME",
+            "help": "RabbitMQ username. Default: SENZING_RABBITMQ_USERNAME"
+        },
+        "--rabbitmq-info-virtual-host": {
+            "dest": "rabbitmq_info_virtual_host",
+            "metavar": "SENZING_RABBITMQ_INFO_VIRTUAL_HOST",
+            "help": "RabbitMQ virtual host. Default: SENZING_RABBITMQ_VIRTUAL_HOST"
+        },
+    },
+    "rabbitmq-redo": {
+        "--rabbitmq-redo-exchange": {
+            "dest": "rabbitmq_redo_exchange",
+            "metavar": "SENZING_RABBITMQ_REDO_EXCHANGE",
+            "help": "RabbitMQ exchange. Default: SENZING_RABBITMQ_EXCHANGE"
+        },
+        "--rabbitmq-redo-host": {
+            "dest": "rabbitmq_redo_host",
+            "metavar": "SENZING_RABBITMQ_REDO_HOST",
+            "help": "RabbitMQ host. Default: SENZING_RABBITMQ_HOST"
+        },
+        "--rabbitmq-redo-password": {
+            "dest": "rabbitmq_redo_password",
+            "metavar": "SENZING_RABBITMQ_REDO_PASSWORD",
+            "help": "RabbitMQ password. Default: SENZING_RABBITMQ_PASSWORD"
+        },
+        "--rabbitmq-redo-queue": {
+            "dest": "rabbitmq_redo_queue",
+            "metavar": "SENZING_RABBITMQ_REDO_QUEUE",
+            "help": "RabbitMQ queue. Default: senzing-rabbitmq-redo-queue"
+        },
+        "--rabbitmq-redo-routing-key": {
+            "dest": "rabbitmq_redo_routing_key",
+            "metavar": "SENZING_RABBITMQ_REDO_ROUTING_KEY",
+            "help": "RabbitMQ routing key. Default: senzing.redo"
+        },
+        "--rabbitmq-redo-username": {
+            "dest": "rabbitmq_redo_username",
+            "metavar": "SENZING_RABBITMQ_REDO_USERNAME",
+            "help": "RabbitMQ username. Default: SENZING_RABBITMQ_USERNAME"
+        },
+        "--rabbitmq-redo-virtual-host": {
+            "dest": "rabbitmq_redo_virtual_host",
+            "metavar": "SENZING_RABBITMQ_redo_VIRTUAL_HOST",
+            "help": "RabbitMQ virtual host. Default: SENZING_RABBITMQ_VIRTUAL_HOST"
+        },
+    },
+    "sqs-failure": {
+        "--sqs-failure-queue-url": {
+            "dest": "sqs_failure_queue_url",
+            "metavar": "SENZING_SQS_FAILURE_QUEUE_URL",
+            "help": "AWS SQS failure URL. Default: none"
+        },
+    },
+    "sqs-info": {
+        "--sqs-info-queue-url": {
+            "dest": "sqs_info_queue_url",
+            "metavar": "SENZING_SQS_INFO_QUEUE_URL",
+            "help": "AWS SQS info URL. Default: none"
+        },
+    },
+    "sqs-redo": {
+        "--sqs-redo-queue-url": {
+            "dest": "sqs_redo_queue_url",
+            "metavar": "SENZING_SQS_REDO_QUEUE_URL",
+            "help": "AWS SQS redo URL. Default: none"
+        },
+    },
+    "threads": {
+        "--threads-per-process": {
+            "dest": "threads_per_process",
+            "metavar": "SENZING_THREADS_PER_PROCESS",
+            "help": "Number of threads per process. Default: 4"
+        }
+    },
+}
 
-    # Augment "subcommands" variable with arguments specified by aspects.
+# Augment "SUBCOMMANDS" table with arguments specified by aspects.
 
-    for subcommand_value in subcommands.values():
-        if 'argument_aspects' in subcommand_value:
-            for aspect in subcommand_value['argument_aspects']:
-                if 'arguments' not in subcommand_value:
-                    subcommand_value['arguments'] = {}
-                arguments = argument_aspects.get(aspect, {})
-                for argument, argument_value in arguments.items():
-                    subcommand_value['arguments'][argument] = argument_value
+for subcommand_value in SUBCOMMANDS.values():
+    aspects = subcommand_value.get('argument_aspects')
+    if not aspects:
+        continue
+    arguments = subcommand_value.setdefault('arguments', {})
+    for aspect in aspects:
+        arguments.update(ARGUMENT_ASPECTS.get(aspect, {}))
 
-    # Parse command line arguments.
+
+@functools.lru_cache(maxsize=1)
+def get_parser():
+    ''' Parse commandline arguments. '''
 
     parser = argparse.ArgumentParser(prog="redoer.py", description="Process Senzing redo records. For more information, see https://github.com/senzing-garage/redoer")
     subparsers = parser.add_subparsers(dest='subcommand', help='Subcommands (SENZING_SUBCOMMAND):')
 
-    for subcommand_key, subcommand_values in subcommands.items():
+    for subcommand_key, subcommand_values in SUBCOMMANDS.items():
         subcommand_help = subcommand_values.get('help', "")
         subcommand_arguments = subcommand_values.get('arguments', {})
         subparser = subparsers.add_parser(subcommand_key, help=subcommand_help)
@@ -911,6 +1105,10 @@ MESSAGE_DICTIONARY = {
     "411": "Thread: {0} RabbitMQ queue: {1} Unknown RabbitMQ error: {2} Message: {3}",
     "413": "Thread: {0} RabbitMQ queue: {1} Unknown RabbitMQ error: {2}",
     "414": "Thread: {0} RabbitMQ queue: {1} Error when trying to send message to RabbitMQ: {2}",
+    "415": "Thread: {0} SQS queue: {1} Failed batch entry: {2}",
+    "416": "Thread: {0} {1} batch send failed on attempt {2}: {3}",
+    "417": "Thread: {0} SQS queue: {1} Dropping batch entry rejected as sender fault: {2}",
+    "418": "Thread: {0} Dropping message larger than the Service Bus batch size limit: {1}",
     "499": "{0}",
     "500": "senzing-" + SENZING_PRODUCT_ID + "{0:04d}E",
     "561": "Thread: {0} Unknown RabbitMQ error when connecting: {1}",
@@ -932,6 +1130,8 @@ MESSAGE_DICTIONARY = {
     "722": "Thread: {0} Kafka commit failed for {1}",
     "723": "Detected inactive thread. Total threads: {0}  Active threads: {1}",
     "730": "There are not enough safe characters to do the translation. Unsafe Characters: {0}; Safe Characters: {1}",
+    "750": "Invalid AWS SQS queue URL: {0}",
+    "751": "Thread: {0} {1} batch send failed after {2} attempts.",
     "801": "G2Engine.getActiveConfigID() error. Error: {0}",
     "802": "G2ConfigurationManager.getDefaultConfigID() error. Error: {0}",
     "803": "G2Engine.reinit() error. Default Configuration ID: {0}; Error: {1}",
@@ -981,16 +1181,38 @@ MESSAGE_DICTIONARY = {
 }
 
 
+# Pre-bind each template's str.format method at import time so that
+# message() is a dictionary lookup plus a single C-level call, rather
+# than a lookup followed by format-string parsing on every log call.
+# Keys are integers, matching what callers pass.
+
+MESSAGE_FORMATTERS = {int(index): template.format for index, template in MESSAGE_DICTIONARY.items()}
+
+# Precompute the "senzing-PPPPNNNNX" prefix for every message/severity
+# combination so message_generic() concatenates two cached strings
+# instead of formatting the "{0:04d}" template on every log call.
+
+MESSAGE_PREFIXES = {
+    (generic_index, index): MESSAGE_DICTIONARY[str(generic_index)].format(index)
+    for generic_index in (MESSAGE_INFO, MESSAGE_WARN, MESSAGE_ERROR, MESSAGE_DEBUG)
+    for index in MESSAGE_FORMATTERS
+}
+
+
 def message(index, *args):
     ''' Return an instantiated message. '''
-    index_string = str(index)
-    template = MESSAGE_DICTIONARY.get(index_string, "No message for index {0}.".format(index_string))
-    return template.format(*args)
+    formatter = MESSAGE_FORMATTERS.get(index)
+    if formatter is None:
+        return "No message for index {0}.".format(index)
+    return formatter(*args)
 
 
 def message_generic(generic_index, index, *args):
     ''' Return a formatted message. '''
-    return "{0} {1}".format(message(generic_index, index), message(index, *args))
+    prefix = MESSAGE_PREFIXES.get((generic_index, index))
+    if prefix is None:
+        prefix = message(generic_index, index)
+    return prefix + " " + message(index, *args)
 
 
 def message_info(index, *args):
@@ -1013,21 +1235,31 @@ def message_debug(index, *args):
     return message_generic(MESSAGE_DEBUG, index, *args)
 
 
+def debug_logging_enabled():
+    ''' Return True if debug-level log messages will be emitted.
+        Used to skip message construction entirely on per-message paths
+        when debug logging is off. '''
+    return logging.getLogger().isEnabledFor(logging.DEBUG)
+
+
 def get_exception():
     ''' Get details about an exception. '''
-    exception_type, exception_object, traceback = sys.exc_info()
-    frame = traceback.tb_frame
-    line_number = traceback.tb_lineno
+    exception_type, exception_object, exception_traceback = sys.exc_info()
+    frame = exception_traceback.tb_frame
+    line_number = exception_traceback.tb_lineno
     filename = frame.f_code.co_filename
-    linecache.checkcache(filename)
-    line = linecache.getline(filename, line_number, frame.f_globals)
+    line = traceback.format_exception_only(exception_type, exception_object)[-1]
+
+    # The traceback object itself is deliberately not returned; holding
+    # it retains every frame (and whatever those frames reference) for
+    # as long as the caller keeps the result.
+
     return {
         "filename": filename,
         "line_number": line_number,
         "line": line.strip(),
         "exception": exception_object,
         "type": exception_type,
-        "traceback": traceback,
     }
 
 # -----------------------------------------------------------------------------
@@ -1035,33 +1267,78 @@ def get_exception():
 # -----------------------------------------------------------------------------
 
 
-def translate(a_map, astring):
-    ''' Translate characters. '''
+def split_url(url):
+    ''' Decompose a URL into urlparse-style components using only
+        str.split/str.rsplit.  Avoids urllib.parse's multiple scanning
+        passes and ParseResult named-tuple allocation, and tolerates
+        non-numeric port text that urlparse's port property rejects.
+        Returns (scheme, netloc, path, params, query, fragment,
+        username, password, hostname, port).
+    '''
 
-    new_string = str(astring)
-    for key, value in a_map.items():
-        new_string = new_string.replace(key, value)
-    return new_string
+    scheme = ''
+    rest = url
+    if '://' in url:
+        scheme, rest = url.split('://', 1)
+        scheme = scheme.lower()
+
+    # Split off fragment and query, in that order, like urlparse.
+
+    fragment = ''
+    if '#' in rest:
+        rest, fragment = rest.split('#', 1)
+    query = ''
+    if '?' in rest:
+        rest, query = rest.split('?', 1)
+
+    # Separate network location from path.
+
+    netloc = rest
+    path = ''
+    for separator_index, character in enumerate(rest):
+        if character == '/':
+            netloc = rest[:separator_index]
+            path = rest[separator_index:]
+            break
+
+    # Parameters follow a ';' in the final path segment.
+
+    params = ''
+    last_segment = path.rsplit('/', 1)[-1]
+    if ';' in last_segment:
+        path, params = path.rsplit(';', 1)
+
+    # Decompose the network location.
+
+    username = None
+    password = None
+    host_port = netloc
+    if '@' in netloc:
+        user_info, host_port = netloc.rsplit('@', 1)
+        username = user_info
+        if ':' in user_info:
+            username, password = user_info.split(':', 1)
+    hostname = host_port
+    port = None
+    if ':' in host_port:
+        hostname, port = host_port.split(':', 1)
+    hostname = hostname.lower() or None
+
+    return scheme, netloc, path, params, query, fragment, username, password, hostname, port
 
 
 def get_unsafe_characters(astring):
     ''' Return the list of unsafe characters found in astring. '''
 
-    result = []
-    for unsafe_character in UNSAFE_CHARACTER_LIST:
-        if unsafe_character in astring:
-            result.append(unsafe_character)
-    return result
+    characters = frozenset(astring)
+    return [character for character in UNSAFE_CHARACTER_LIST if character in characters]
 
 
 def get_safe_characters(astring):
     ''' Return the list of safe characters found in astring. '''
 
-    result = []
-    for safe_character in SAFE_CHARACTER_LIST:
-        if safe_character not in astring:
-            result.append(safe_character)
-    return result
+    characters = frozenset(astring)
+    return [character for character in SAFE_CHARACTER_LIST if character not in characters]
 
 
 def parse_database_url(original_senzing_database_url):
@@ -1084,50 +1361,51 @@ def parse_database_url(original_senzing_database_url):
         logging.error(message_error(730, unsafe_characters, safe_characters))
         return result
 
-    # Perform translation.
-    # This makes a map of safe character mapping to unsafe characters.
+    # Perform translation in a single str.translate() pass.
+    # "translation_map" maps each safe character back to the unsafe
+    # character it stands in for.
     # "senzing_database_url" is modified to have only safe characters.
 
-    translation_map = {}
-    safe_characters_index = 0
-    for unsafe_character in unsafe_characters:
-        safe_character = safe_characters[safe_characters_index]
-        safe_characters_index += 1
-        translation_map[safe_character] = unsafe_character
-        senzing_database_url = senzing_database_url.replace(unsafe_character, safe_character)
+    translation_map = dict(zip(safe_characters, unsafe_characters))
+    senzing_database_url = senzing_database_url.translate(str.maketrans(dict(zip(unsafe_characters, safe_characters))))
 
     # Parse "translated" URL.
 
-    parsed = urlparse(senzing_database_url)
-    schema = parsed.path.strip('/')
+    scheme, netloc, path, params, query, fragment, username, password, hostname, port = split_url(senzing_database_url)
+    schema = path.strip('/')
 
-    # Construct result.
+    # Construct result, reversing the translation with one C-level
+    # table pass per component.
+
+    reverse_table = str.maketrans(translation_map)
+
+    def untranslate(astring):
+        return str(astring).translate(reverse_table)
+
+    scheme = untranslate(scheme)
+    netloc = untranslate(netloc)
+    path = untranslate(path)
+    params = untranslate(params)
+    query = untranslate(query)
+    fragment = untranslate(fragment)
 
     result = {
-        'scheme': translate(translation_map, parsed.scheme),
-        'netloc': translate(translation_map, parsed.netloc),
-        'path': translate(translation_map, parsed.path),
-        'params': translate(translation_map, parsed.params),
-        'query': translate(translation_map, parsed.query),
-        'fragment': translate(translation_map, parsed.fragment),
-        'username': translate(translation_map, parsed.username),
-        'password': translate(translation_map, parsed.password),
-        'hostname': translate(translation_map, parsed.hostname),
-        'port': translate(translation_map, parsed.port),
-        'schema': translate(translation_map, schema),
+        'scheme': scheme,
+        'netloc': netloc,
+        'path': path,
+        'params': params,
+        'query': query,
+        'fragment': fragment,
+        'username': untranslate(username),
+        'password': untranslate(password),
+        'hostname': untranslate(hostname),
+        'port': untranslate(port),
+        'schema': untranslate(schema),
     }
 
     # For safety, compare original URL with reconstructed URL.
 
-    url_parts = [
-        result.get('scheme'),
-        result.get('netloc'),
-        result.get('path'),
-        result.get('params'),
-        result.get('query'),
-        result.get('fragment'),
-    ]
-    test_senzing_database_url = urlunparse(url_parts)
+    test_senzing_database_url = urlunparse((scheme, netloc, path, params, query, fragment))
     if test_senzing_database_url != original_senzing_database_url:
         logging.warning(message_warning(891, original_senzing_database_url, test_senzing_database_url))
 
@@ -1167,35 +1445,22 @@ def get_g2_database_url_specific(generic_database_url):
 
 def get_configuration(subcommand, args):
     ''' Order of precedence: CLI, OS environment variables, INI file, default. '''
-    result = {}
 
-    # Copy default values into configuration dictionary.
+    # Build one overlay per source, then merge defaults < OS environment
+    # variables < command line arguments in a single C-level dict union.
+    # Snapshot os.environ into a plain dict first; every lookup on the
+    # os.environ mapping proxy goes through its Python-level __getitem__.
 
-    for key, value in list(CONFIGURATION_LOCATOR.items()):
-        result[key] = value.get('default', None)
+    environ = dict(os.environ)
+    from_env = {}
+    for key, os_env_var in CONFIGURATION_ENV_VARS:
+        os_env_value = environ.get(os_env_var)
+        if os_env_value:
+            from_env[key] = os_env_value
 
-    # "Prime the pump" with command line args. This will be done again as the last step.
+    from_args = {key: value for key, value in args.__dict__.items() if value}
 
-    for key, value in list(args.__dict__.items()):
-        new_key = key.format(subcommand.replace('-', '_'))
-        if value:
-            result[new_key] = value
-
-    # Copy OS environment variables into configuration dictionary.
-
-    for key, value in list(CONFIGURATION_LOCATOR.items()):
-        os_env_var = value.get('env', None)
-        if os_env_var:
-            os_env_value = os.getenv(os_env_var, None)
-            if os_env_value:
-                result[key] = os_env_value
-
-    # Copy 'args' into configuration dictionary.
-
-    for key, value in list(args.__dict__.items()):
-        new_key = key.format(subcommand.replace('-', '_'))
-        if value:
-            result[new_key] = value
+    result = {**dict(CONFIGURATION_DEFAULTS), **from_env, **from_args}
 
     # Add program information.
 
@@ -1215,41 +1480,15 @@ def get_configuration(subcommand, args):
 
     # Special case: Change boolean strings to booleans.
 
-    booleans = [
-        'debug',
-        'exit_on_thread_termination',
-        'rabbitmq_use_existing_entities',
-        'run_gdb',
-    ]
-    for boolean in booleans:
+    for boolean in CONFIGURATION_BOOLEAN_KEYS:
         boolean_value = result.get(boolean)
         if isinstance(boolean_value, str):
-            boolean_value_lower_case = boolean_value.lower()
-            if boolean_value_lower_case in ['true', '1', 't', 'y', 'yes']:
-                result[boolean] = True
-            else:
-                result[boolean] = False
+            result[boolean] = boolean_value.lower() in TRUTHY_VALUES
 
     # Special case: Change integer strings to integers.
 
-    integers = [
-        'delay_in_seconds',
-        'expiration_warning_in_days',
-        'log_license_period_in_seconds',
-        'monitoring_period_in_seconds',
-        'queue_maxsize',
-        'rabbitmq_heartbeat_in_seconds',
-        'rabbitmq_reconnect_delay_in_seconds',
-        'redo_sleep_time_in_seconds',
-        'redo_retry_sleep_time_in_seconds',
-        'redo_retry_limit',
-        'sleep_time_in_seconds',
-        'threads_per_read_process',
-        'threads_per_process'
-    ]
-    for integer in integers:
-        integer_string = result.get(integer)
-        result[integer] = int(integer_string)
+    for integer in CONFIGURATION_INTEGER_KEYS:
+        result[integer] = int(result[integer])
 
     # Special case:  Tailored database URL
 
@@ -1257,15 +1496,7 @@ def get_configuration(subcommand, args):
 
     # Initialize counters.
 
-    counters = [
-        'processed_redo_records',
-        'sent_to_failure_queue',
-        'sent_to_info_queue',
-        'sent_to_redo_queue',
-        'received_from_redo_queue',
-        'redo_records_from_senzing_engine'
-    ]
-    for counter in counters:
+    for counter in COUNTER_KEYS:
         result[counter] = 0
 
     return result
@@ -1310,13 +1541,7 @@ def validate_configuration(config):
 
 def redact_configuration(config):
     ''' Return a shallow copy of config with certain keys removed. '''
-    result = config.copy()
-    for key in KEYS_TO_REDACT:
-        try:
-            result.pop(key)
-        except Exception:
-            pass
-    return result
+    return {key: value for key, value in config.items() if key not in KEYS_TO_REDACT}
 
 # -----------------------------------------------------------------------------
 # Class: Governor
@@ -1325,6 +1550,8 @@ def redact_configuration(config):
 
 class Governor:
 
+    __slots__ = ('g2_engine', 'hint')
+
     def __init__(self, *args, g2_engine=None, hint=None, **kwargs):
         self.g2_engine = g2_engine
         self.hint = hint
@@ -1348,22 +1575,133 @@ class Governor:
 
 class InfoFilter:
 
+    __slots__ = ('g2_engine',)
+
     def __init__(self, *args, g2_engine=None, **kwargs):
         self.g2_engine = g2_engine
 
     def filter(self, *args, message=None, **kwargs):
         return message
 
+# -----------------------------------------------------------------------------
+# Class: InternalQueue
+# -----------------------------------------------------------------------------
+
+
+class InternalQueue:
+    '''
+    A queue.SimpleQueue plus a Semaphore providing the maxsize
+    backpressure that queue.Queue would otherwise supply.  SimpleQueue's
+    put/get run in C with a single lock, avoiding queue.Queue's
+    per-operation Condition signalling.
+    '''
+
+    def __init__(self, maxsize=0):
+        self.queue = queue.SimpleQueue()
+        self.semaphore = threading.Semaphore(maxsize) if maxsize > 0 else None
+
+    def put(self, item):
+        if self.semaphore is not None:
+            self.semaphore.acquire()  # pylint: disable=consider-using-with
+        self.queue.put(item)
+
+    def get(self):
+        item = self.queue.get()
+        if self.semaphore is not None:
+            self.semaphore.release()
+        return item
+
+    def get_nowait(self):
+        item = self.queue.get_nowait()
+        if self.semaphore is not None:
+            self.semaphore.release()
+        return item
+
 # -----------------------------------------------------------------------------
 # RabbitMQ publish and subscribe threads
 # -----------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=None)
+def get_rabbitmq_connection_parameters(username, password, host, virtual_host, heartbeat):
+    '''
+    Return a pika.ConnectionParameters, cached so threads talking to the
+    same broker share one parameters object instead of each building its
+    own credentials and parameters.
+    '''
+
+    return pika.ConnectionParameters(
+        credentials=pika.PlainCredentials(
+            username=username,
+            password=password,
+        ),
+        host=host,
+        heartbeat=heartbeat,
+        virtual_host=virtual_host
+    )
+
+
+class RabbitmqConnectionPool:
+    '''
+    Share one long-lived pika.BlockingConnection among the Rabbitmq
+    instances owned by a single thread, giving each instance its own
+    channel.  This avoids one TCP + AMQP handshake per queue and keeps
+    the broker's connection count proportional to threads, not queues.
+    pika's BlockingConnection is not thread-safe, so a pool must never
+    be shared across threads.
+    '''
+
+    # RabbitMQ caps channels per connection at 2047; stay clear of it.
+
+    channel_limit = 2000
+
+    def __init__(self):
+        self.connections = {}
+
+    def acquire_channel(self, connection_parameters):
+        '''
+        Return a new channel on the pooled connection for the given
+        connection parameters, (re)connecting as needed.
+        '''
+
+        key = (
+            connection_parameters.host,
+            connection_parameters.virtual_host,
+            connection_parameters.credentials.username,
+        )
+        entry = self.connections.get(key)
+        if entry is None or not entry[0].is_open or entry[1] >= self.channel_limit:
+            entry = [pika.BlockingConnection(connection_parameters), 0]
+            self.connections[key] = entry
+        entry[1] += 1
+        return entry[0].channel()
+
+# -----------------------------------------------------------------------------
+# Class: Rabbitmq
+# -----------------------------------------------------------------------------
+
+
 class Rabbitmq:
     '''
     https://github.com/pika/pika/issues/1104
     '''
 
+    __slots__ = (
+        'backoff',
+        'channel',
+        'connection',
+        'connection_parameters',
+        'delivery_mode',
+        'exchange',
+        'passive',
+        'pool',
+        'prefetch_count',
+        'publish_properties',
+        'queue_name',
+        'reconnect_delay_in_seconds',
+        'routing_key',
+    )
+
     def __init__(
             self,
             username,
@@ -1377,9 +1715,11 @@ class Rabbitmq:
             passive,
             delivery_mode=2,
             prefetch_count=1,
-            reconnect_delay_in_seconds=60
+            reconnect_delay_in_seconds=60,
+            pool=None
         ):
 
+        load_pika()
         logging.debug(message_debug(995, threading.current_thread().name, "Rabbitmq"))
 
         # Check input parameter data types.
@@ -1396,8 +1736,10 @@ class Rabbitmq:
 
         # Instance variables.
 
+        self.backoff = 1.0
         self.delivery_mode = delivery_mode
         self.exchange = exchange
+        self.pool = pool
         self.queue_name = queue_name
         self.passive = passive
         self.routing_key = routing_key
@@ -1406,26 +1748,41 @@ class Rabbitmq:
 
         # Create a RabbitMQ connection and channel.
 
-        self.credentials = pika.PlainCredentials(
-            username=username,
-            password=password,
-        )
-        self.connection_parameters = pika.ConnectionParameters(
-            credentials=self.credentials,
-            host=host,
-            heartbeat=heartbeat,
-            virtual_host=virtual_host
+        self.connection_parameters = get_rabbitmq_connection_parameters(username, password, host, virtual_host, heartbeat)
+
+        # Publish properties never change; build them once instead of
+        # allocating a BasicProperties per message in send().
+
+        self.publish_properties = pika.BasicProperties(
+            delivery_mode=self.delivery_mode,
         )
 
         self.connection, self.channel = self.connect()
 
+    def next_reconnect_delay(self):
+        '''
+        Return the next reconnect delay: exponential backoff with a
+        little jitter, capped at reconnect_delay_in_seconds.  Retries
+        short blips quickly while spreading the reconnect attempts of
+        many threads so a recovering broker is not hit by a handshake
+        spike.
+        '''
+
+        delay = min(self.backoff, self.reconnect_delay_in_seconds) + random.uniform(0, 0.5)
+        self.backoff = min(self.backoff * 2, self.reconnect_delay_in_seconds)
+        return delay
+
     def connect(self, exit_on_exception=True):
 
         connection = None
         channel = None
         try:
-            connection = pika.BlockingConnection(self.connection_parameters)
-            channel = connection.channel()
+            if self.pool is not None:
+                channel = self.pool.acquire_channel(self.connection_parameters)
+                connection = channel.connection
+            else:
+                connection = pika.BlockingConnection(self.connection_parameters)
+                channel = connection.channel()
             channel.basic_qos(
                 prefetch_count=self.prefetch_count,
             )
@@ -1464,17 +1821,22 @@ class Rabbitmq:
 
     def receive(self, callback=None):
 
+        # Run callbacks on a small reusable pool instead of spawning a
+        # thread per message and busy-waiting on it with 5-second
+        # process_data_events() polls.  on_message_callback() returns
+        # immediately, so pika's own IO loop keeps heartbeats alive even
+        # while a callback blocks on internal-queue backpressure, and
+        # prefetch_count bounds the number of messages in flight.
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.prefetch_count)
+
         def on_message_callback(channel, method, properties, body):
-            logging.debug(message_debug(917, threading.current_thread().name, self.queue_name, body))
+            self.backoff = 1.0
+            if debug_logging_enabled():
+                logging.debug(message_debug(917, threading.current_thread().name, self.queue_name, body))
 
             if callback is not None:
-                my_thread = threading.Thread(target=callback, args=(body, method))
-                my_thread.daemon = True
-                my_thread.start()
-
-                while my_thread.is_alive():
-                    self.connection.process_data_events()
-                    self.connection.sleep(5)
+                executor.submit(callback, body, method)
 
         while True:
             try:
@@ -1492,8 +1854,9 @@ class Rabbitmq:
             except BaseException as err:
                 logging.warning(message_warning(413, threading.current_thread().name, self.queue_name, err))
 
-            logging.info(message_info(132, self.reconnect_delay_in_seconds))
-            time.sleep(self.reconnect_delay_in_seconds)
+            delay = self.next_reconnect_delay()
+            logging.info(message_info(132, delay))
+            time.sleep(delay)
 
             # Reconnect to RabbitMQ queue.
 
@@ -1517,9 +1880,9 @@ class Rabbitmq:
             logging.info(message_info(135, threading.current_thread().name, err))
 
     def send(self, message):
-        logging.debug(message_debug(916, threading.current_thread().name, self.queue_name, message))
-        assert isinstance(message, str)
-        message_bytes = message.encode()
+        if debug_logging_enabled():
+            logging.debug(message_debug(916, threading.current_thread().name, self.queue_name, message))
+        message_bytes = message if isinstance(message, bytes) else message.encode()
         while True:
             try:
                 if self.channel is not None and self.channel.is_open:
@@ -1527,25 +1890,66 @@ class Rabbitmq:
                         exchange=self.exchange,
                         routing_key=self.routing_key,
                         body=message_bytes,
-                        properties=pika.BasicProperties(
-                            delivery_mode=self.delivery_mode,
-                        ),
+                        properties=self.publish_properties,
                     )
+                    self.backoff = 1.0
                     break
             except pika.exceptions.StreamLostError as err:
                 logging.warning(message_warning(414, threading.current_thread().name, self.queue_name, err))
             except Exception as err:
                 logging.warning(message_warning(411, threading.current_thread().name, self.queue_name, err, message))
 
-            logging.info(message_info(132, self.reconnect_delay_in_seconds))
-            time.sleep(self.reconnect_delay_in_seconds)
+            delay = self.next_reconnect_delay()
+            logging.info(message_info(132, delay))
+            time.sleep(delay)
+
+            self.connection, self.channel = self.connect(
+                exit_on_exception=False
+            )
+
+    def send_batch(self, messages):
+        '''
+        Publish several messages back-to-back on the persistent channel,
+        amortizing send() overhead and error handling across the batch.
+        Messages already published before a connection failure are not
+        republished.
+        '''
+
+        if debug_logging_enabled():
+            logging.debug(message_debug(916, threading.current_thread().name, self.queue_name, messages))
+        pending = [message if isinstance(message, bytes) else message.encode() for message in messages]
+        index = 0
+        while index < len(pending):
+            try:
+                if self.channel is not None and self.channel.is_open:
+                    while index < len(pending):
+                        self.channel.basic_publish(
+                            exchange=self.exchange,
+                            routing_key=self.routing_key,
+                            body=pending[index],
+                            properties=self.publish_properties,
+                        )
+                        index += 1
+                    self.backoff = 1.0
+                    break
+            except pika.exceptions.StreamLostError as err:
+                logging.warning(message_warning(414, threading.current_thread().name, self.queue_name, err))
+            except Exception as err:
+                logging.warning(message_warning(411, threading.current_thread().name, self.queue_name, err, messages[index]))
+
+            delay = self.next_reconnect_delay()
+            logging.info(message_info(132, delay))
+            time.sleep(delay)
 
             self.connection, self.channel = self.connect(
                 exit_on_exception=False
             )
 
     def close(self):
-        self.connection.close()
+        if self.pool is not None:
+            self.channel.close()
+        else:
+            self.connection.close()
 
 
 class RabbitmqSubscribeThread(threading.Thread):
@@ -1555,15 +1959,15 @@ class RabbitmqSubscribeThread(threading.Thread):
 
     def __init__(self, internal_queue, host, exchange, virtual_host, heartbeat, queue_name, routing_key, username, password, passive, prefetch_count, reconnect_delay_in_seconds):
         threading.Thread.__init__(self)
-        logging.debug(message_debug(997, threading.current_thread().name, "RabbitmqSubscribeThread"))
-
-        logging.debug(message_debug(
-            915,
-            threading.current_thread().name,
-            host,
-            queue_name,
-            username,
-            prefetch_count))
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "RabbitmqSubscribeThread"))
+            logging.debug(message_debug(
+                915,
+                threading.current_thread().name,
+                host,
+                queue_name,
+                username,
+                prefetch_count))
 
         self.internal_queue = internal_queue
         self.queue_name = queue_name
@@ -1588,10 +1992,10 @@ class RabbitmqSubscribeThread(threading.Thread):
         '''
         Put message into internal queue.
         '''
-        logging.debug(message_debug(917, threading.current_thread().name, self.queue_name, message))
+        if debug_logging_enabled():
+            logging.debug(message_debug(917, threading.current_thread().name, self.queue_name, message))
         if isinstance(message, bytes):
             message = message.decode()
-        assert isinstance(message, str)
         self.internal_queue.put((message, method.delivery_tag))
 
     def ack_message(self, delivery_tag):
@@ -1613,17 +2017,26 @@ class MonitorThread(threading.Thread):
     def __init__(self, config=None, g2_engine=None, workers=None):
         threading.Thread.__init__(self)
         self.config = config
-        self.digits_regex_pattern = re.compile(r':\d+$')
         self.exit_on_thread_termination = self.config.get("exit_on_thread_termination")
         self.g2_engine = g2_engine
-        self.in_regex_pattern = re.compile(r'\sin\s')
+        self.g2_engine_stats_response = bytearray()
         self.log_level_parameter = config.get("log_level_parameter")
         self.log_license_period_in_seconds = self.config.get("log_license_period_in_seconds")
         self.pstack_pid = config.get("pstack_pid")
         self.run_gdb = self.config.get('run_gdb')
         self.sleep_time_in_seconds = self.config.get('monitoring_period_in_seconds')
+        self.stop_event = threading.Event()
         self.workers = workers
 
+        # Precompute the "<key>_total"/"<key>_interval" stat names once;
+        # the monitor loop otherwise re-formats them every tick.
+
+        self.stat_keys = tuple((key, key + "_total", key + "_interval") for key in COUNTER_KEYS)
+
+    def get_counter_total(self, key):
+        ''' Sum a per-thread counter across all worker threads. '''
+        return self.config.get(key, 0) + sum(worker.counters.get(key, 0) for worker in self.workers)
+
     def run(self):
         '''Periodically monitor what is happening.'''
 
@@ -1633,45 +2046,39 @@ class MonitorThread(threading.Thread):
 
         # Initialize variables.
 
-        last = {
-            "processed_redo_records": 0,
-            "sent_to_failure_queue": 0,
-            "sent_to_info_queue": 0,
-            "sent_to_redo_queue": 0,
-            "received_from_redo_queue": 0,
-            "redo_records_from_senzing_engine": 0,
-        }
+        last = dict.fromkeys(COUNTER_KEYS, 0)
 
         last_log_license = time.time()
 
         # Sleep-monitor loop.
 
-        active_workers = len(self.workers)
-        for worker in self.workers:
-            if not worker.is_alive():
-                active_workers -= 1
+        workers = self.workers
+        active_workers = sum(1 for worker in workers if worker.is_alive())
+
+        # Wait on an Event rather than time.sleep() so the main thread can
+        # wake this loop immediately at shutdown instead of letting it
+        # sleep out the remainder of the monitoring period.
 
+        stop_event = self.stop_event
         while active_workers > 0:
 
-            time.sleep(self.sleep_time_in_seconds)
+            if stop_event.wait(self.sleep_time_in_seconds):
+                break
 
             # Calculate active Threads.
 
-            active_workers = len(self.workers)
-            for worker in self.workers:
-                if not worker.is_alive():
-                    active_workers -= 1
+            active_workers = sum(1 for worker in workers if worker.is_alive())
 
             # Determine if we're running out of workers.
 
-            if (active_workers / float(len(self.workers))) < 0.5:
+            if (active_workers / float(len(workers))) < 0.5:
                 logging.warning(message_warning(721))
 
             # If requested, terminate all threads if any thread is not active.
 
             if self.exit_on_thread_termination:
-                if len(self.workers) != active_workers:
-                    exit_error_program(723, active_workers, len(self.workers))
+                if len(workers) != active_workers:
+                    exit_error_program(723, active_workers, len(workers))
 
             # Calculate times.
 
@@ -1689,83 +2096,86 @@ class MonitorThread(threading.Thread):
 
             stats = {
                 "uptime": int(uptime),
-                "workers_total": len(self.workers),
+                "workers_total": len(workers),
                 "workers_active": active_workers,
             }
 
-            # Tricky code.  Avoid modifying dictionary in the loop.
-            # i.e. "for key, value in last.items():" would loop infinitely
-            # because of "last[key] = total".
-
-            keys = last.keys()
-            for key in keys:
-                value = last.get(key)
-                total = self.config.get(key)
-                interval = total - value
-                stats["{0}_total".format(key)] = total
-                stats["{0}_interval".format(key)] = interval
+            get_counter_total = self.get_counter_total
+            for key, total_key, interval_key in self.stat_keys:
+                total = get_counter_total(key)
+                stats[total_key] = total
+                stats[interval_key] = total - last[key]
                 last[key] = total
 
-            logging.info(message_info(127, json.dumps(stats, sort_keys=True)))
+            # "stats" is built in a fixed, stable order, so there is no
+            # need to have json.dumps() re-sort the keys every tick.
+
+            logging.info(message_info(127, dump_json(stats)))
 
             # Log engine statistics with sorted JSON keys.
 
-            g2_engine_stats_response = bytearray()
+            g2_engine_stats_response = self.g2_engine_stats_response
+            g2_engine_stats_response.clear()
             self.g2_engine.stats(g2_engine_stats_response)
-            g2_engine_stats_dictionary = json.loads(g2_engine_stats_response.decode())
-            logging.info(message_info(125, json.dumps(g2_engine_stats_dictionary, sort_keys=True)))
+            g2_engine_stats_dictionary = load_json(g2_engine_stats_response)
+            logging.info(message_info(125, dump_json(g2_engine_stats_dictionary, sort_keys=True)))
 
             # If requested, debug stacks.
 
             if self.run_gdb:
-                completed_process = None
                 try:
 
-                    # Run gdb to get stacks.
-
-                    completed_process = subprocess.run(
-                        ["gdb", "-q", "-p", self.pstack_pid, "-batch", "-ex", "thread apply all bt"],
-                        capture_output=True,
-                        check=True)
+                    # Run gdb to get stacks.  Stream stdout line-by-line so
+                    # only the filtered frames are held in memory instead of
+                    # buffering the full stack dump.
 
-                except Exception as err:
-                    logging.warning(message_warning(999, err))
+                    with subprocess.Popen(
+                            ["gdb", "-q", "-p", self.pstack_pid, "-batch", "-ex", "thread apply all bt"],
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE) as gdb_process:
 
-                if completed_process is not None:
+                        # Process gdb output.  Filter in byte-space so only
+                        # the surviving frames — typically a small fraction
+                        # of the dump — are UTF-8 decoded.
 
-                    # Process gdb output.
+                        counter = 0
+                        stdout_dict = {}
+                        for stdout_line in gdb_process.stdout:
 
-                    counter = 0
-                    stdout_dict = {}
-                    stdout_lines = str(completed_process.stdout).split('\\n')
-                    for stdout_line in stdout_lines:
+                            # Filter lines: keep frames that mention " in " and
+                            # end with a ":<line-number>" suffix.  Plain substring
+                            # and isdigit() checks; no regex engine needed.
 
-                        # Filter lines.
+                            stdout_line = stdout_line.rstrip(b'\n')
+                            if b' in ' in stdout_line and stdout_line.rsplit(b':', 1)[-1].isdigit():
 
-                        if self.digits_regex_pattern.search(stdout_line) is not None and self.in_regex_pattern.search(stdout_line) is not None:
+                                # Format lines.  Split at most 4 times; only
+                                # fields 0, 3, and the tail are used, and the
+                                # source path sits after the last '/' of the
+                                # tail.
 
-                            # Format lines.
+                                line_parts = stdout_line.split(None, 4)
+                                if len(line_parts) < 5:
+                                    continue
+                                counter += 1
+                                output_line = b"%-3s %s %s" % (line_parts[0], line_parts[3], line_parts[4].rsplit(b'/', 1)[-1])
+                                stdout_dict[f"{counter:04d}"] = output_line.decode('utf-8', 'replace')
 
-                            counter += 1
-                            line_parts = stdout_line.split()
-                            output_line = "{0:<3} {1} {2}".format(line_parts[0], line_parts[3], line_parts[-1].rsplit('/', 1)[-1])
-                            stdout_dict[str(counter).zfill(4)] = output_line
+                        # Log STDOUT.
 
-                    # Log STDOUT.
+                        stdout_json = dump_json(stdout_dict)
+                        logging.debug(message_debug(920, stdout_json))
 
-                    stdout_json = json.dumps(stdout_dict)
-                    logging.debug(message_debug(920, stdout_json))
+                        # Log STDERR.
 
-                    # Log STDERR.
+                        stderr_dict = {}
+                        for counter, stderr_line in enumerate(gdb_process.stderr, 1):
+                            stderr_dict[f"{counter:04d}"] = stderr_line.rstrip(b'\n').decode('utf-8', 'replace')
+                        stderr_json = dump_json(stderr_dict)
+                        logging.debug(message_debug(921, stderr_json))
 
-                    counter = 0
-                    stderr_dict = {}
-                    stderr_lines = str(completed_process.stderr).split('\\n')
-                    for stderr_line in stderr_lines:
-                        counter += 1
-                        stderr_dict[str(counter).zfill(4)] = stderr_line
-                    stderr_json = json.dumps(stderr_dict)
-                    logging.debug(message_debug(921, stderr_json))
+                except Exception as err:
+                    logging.warning(message_warning(999, err))
 
         logging.info(message_info(181))
 
@@ -1775,7 +2185,7 @@ class MonitorThread(threading.Thread):
 #   - redo_records() -> generated list of strings
 #   Classes:
 #   - InputAzureQueueMixin - Gets redo records from Azure Queue
-#   - InputInternalMixin - Gets redo records from internal queue
+#   - InputG2EngineMixin - Gets redo records directly from the Senzing engine
 #   - InputKafkaMixin - Gets redo records from Kafka
 #   - InputRabbitmqMixin - Gets redo records from RabbitMQ
 #   - InputSqsMixin - Gets redo records from AWS SQS
@@ -1789,14 +2199,17 @@ class MonitorThread(threading.Thread):
 class InputAzureQueueMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "InputAzureQueueMixin"))
+        load_azure_servicebus()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "InputAzureQueueMixin"))
         connection_string = self.config.get("azure_queue_connection_string")
         queue_name = self.config.get("azure_queue_name")
 
         # Create objects.
 
-        servicebus_client = ServiceBusClient.from_connection_string(connection_string)
-        self.receiver = servicebus_client.get_queue_receiver(queue_name=queue_name)
+        servicebus_client = get_servicebus_client(connection_string)
+        self.receiver = servicebus_client.get_queue_receiver(queue_name=queue_name, prefetch_count=50)
+        super().__init__(*args, **kwargs)
 
     def redo_records(self):
         '''
@@ -1804,17 +2217,20 @@ class InputAzureQueueMixin():
         retrieved from a Azure Queue.
         '''
 
-        # In a loop, get messages from AWS SQS.
+        # In a loop, get batches of messages from Azure Queue.  Pulling
+        # from the one receiver created in __init__ keeps the AMQP link
+        # and its credits alive across iterations.
 
         while True:
 
-            for queue_message in self.receiver:
+            queue_messages = self.receiver.receive_messages(max_message_count=10, max_wait_time=5)
+            for queue_message in queue_messages:
                 message_body = str(queue_message)
 
                 # As a generator, give the value to the co-routine.
 
-                logging.debug(message_debug(918, threading.current_thread().name, "Azure Queue", message_body))
-                assert isinstance(message_body, str)
+                if debug_logging_enabled():
+                    logging.debug(message_debug(918, threading.current_thread().name, "Azure Queue", message_body))
                 yield message_body, queue_message
 
     def acknowledge_read_message(self, queue_message):
@@ -1825,27 +2241,93 @@ class InputAzureQueueMixin():
         self.receiver.complete_message(queue_message)
 
 # -----------------------------------------------------------------------------
-# Class: InputInternalMixin
+# Class: InputG2EngineMixin
 # -----------------------------------------------------------------------------
 
 
-class InputInternalMixin():
+class InputG2EngineMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "InputInternalMixin"))
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "InputG2EngineMixin"))
+        super().__init__(*args, **kwargs)
 
     def redo_records(self):
         '''
         Generator that produces Senzing redo records
-        retrieved from the "internal queue".
+        retrieved directly from the Senzing engine.
+
+        Each worker thread pulls from the engine itself, so records
+        reach process_redo_record() without a hop through the internal
+        queue or a separate reader thread.
         '''
 
+        # Pull values from configuration.
+
+        redo_sleep_time_in_seconds = self.config.get('redo_sleep_time_in_seconds')
+        redo_retry_sleep_time_in_seconds = self.config.get('redo_retry_sleep_time_in_seconds')
+        redo_retry_limit = self.config.get('redo_retry_limit')
+
+        # Initialize variables.
+        # The bytearray is allocated once and refilled by getRedoRecord()
+        # on every iteration; consumers only ever see an immutable
+        # snapshot, so no per-record buffer is allocated here.
+
+        redo_record_bytearray = bytearray()
+        return_code = 0
+        retry_count = 0
+
+        # Bind the engine call to a local; it runs once per record.
+
+        get_redo_record = self.g2_engine.getRedoRecord
+
+        # Read forever.
+
         while True:
-            message = self.redo_queue.get()
-            logging.debug(message_debug(918, threading.current_thread().name, "internal", message))
-            assert isinstance(message, tuple)
-            self.config['received_from_redo_queue'] += 1
-            yield message
+
+            # Read a Senzing redo record.
+
+            try:
+                if debug_logging_enabled():
+                    logging.debug(message_debug(901, threading.current_thread().name))
+                redo_record_bytearray.clear()
+                return_code = get_redo_record(redo_record_bytearray)
+            except G2ModuleNotInitialized as err:
+                exit_error(702, err, redo_record_bytearray.decode())
+            except Exception as err:
+                # OT-TODO: replace this error handling in the future when G2 throws dedicated
+                # failed connection exception.
+                logging.error(message_error(834, err))
+                if is_db_connection_error(str(err)) and retry_count < redo_retry_limit:
+                    retry_count += 1
+                    logging.warning(message_warning(704, err, redo_retry_sleep_time_in_seconds))
+                    time.sleep(redo_retry_sleep_time_in_seconds)
+                    continue
+                exit_error(703, err)
+            if return_code:
+                exit_error(701, return_code)
+
+            # Reset the retry count
+            retry_count = 0
+
+            # If redo record was not received, sleep and try again.
+
+            if not redo_record_bytearray:
+                if debug_logging_enabled():
+                    logging.debug(message_debug(902, threading.current_thread().name, redo_sleep_time_in_seconds))
+                time.sleep(redo_sleep_time_in_seconds)
+                continue
+
+            # Return generator value.
+            # The record stays in byte form; consumers decode only when
+            # a str is actually required.
+
+            redo_record = bytes(redo_record_bytearray)
+            if debug_logging_enabled():
+                logging.debug(message_debug(903, threading.current_thread().name, redo_record))
+            self.counters['redo_records_from_senzing_engine'] += 1
+            self.counters['received_from_redo_queue'] += 1
+            yield redo_record, None
 
 # -----------------------------------------------------------------------------
 # Class: InputKafkaMixin
@@ -1855,7 +2337,9 @@ class InputInternalMixin():
 class InputKafkaMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "InputKafkaMixin"))
+        load_confluent_kafka()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "InputKafkaMixin"))
 
         # Create Kafka client.
 
@@ -1868,6 +2352,14 @@ class InputKafkaMixin():
         self.consumer = confluent_kafka.Consumer(consumer_configuration)
         self.consumer.subscribe([self.config.get("kafka_redo_topic")])
 
+        # Commit offsets in batches rather than once per message.
+
+        self.uncommitted_messages = 0
+        self.commit_batch_size = 100
+        self.commit_deadline_in_seconds = 1.0
+        self.last_commit = time.monotonic()
+        super().__init__(*args, **kwargs)
+
     def redo_records(self):
         '''
         Generator that produces Senzing redo records
@@ -1876,36 +2368,43 @@ class InputKafkaMixin():
 
         while True:
 
-            # Get message from Kafka queue.
-            # Timeout quickly to allow other co-routines to process.
+            # Get a batch of messages from the Kafka queue in a single
+            # librdkafka call.  Timeout quickly to allow other co-routines
+            # to process.
 
-            kafka_message = self.consumer.poll(1.0)
+            kafka_messages = self.consumer.consume(num_messages=500, timeout=1.0)
 
-            # Handle non-standard Kafka output.
+            for kafka_message in kafka_messages:
 
-            if kafka_message is None:
-                continue
-            if kafka_message.error():
-                if kafka_message.error().code() != confluent_kafka.KafkaError._PARTITION_EOF:
-                    logging.error(message_error(722, threading.current_thread().name, kafka_message.error()))
-                continue
+                # Handle non-standard Kafka output.
 
-            # Construct and verify Kafka message.
+                if kafka_message.error():
+                    if kafka_message.error().code() != confluent_kafka.KafkaError._PARTITION_EOF:
+                        logging.error(message_error(722, threading.current_thread().name, kafka_message.error()))
+                    continue
 
-            message = str(kafka_message.value().decode()).strip()
-            if not message:
-                continue
-            self.config['received_from_redo_queue'] += 1
+                # Construct and verify Kafka message.
 
-            # As a generator, give the value to the co-routine.
+                message = str(kafka_message.value().decode()).strip()
+                if not message:
+                    continue
+                self.counters['received_from_redo_queue'] += 1
+
+                # As a generator, give the value to the co-routine.
 
-            logging.debug(message_debug(918, threading.current_thread().name, "Kafka", message))
-            assert isinstance(message, str)
-            yield message, None
+                if debug_logging_enabled():
+                    logging.debug(message_debug(918, threading.current_thread().name, "Kafka", message))
+                yield message, None
 
-            # After successful import into Senzing, tell Kafka we're done with message.
+                # After successful import into Senzing, tell Kafka we're done with message.
+                # Offsets are committed every commit_batch_size messages or once
+                # commit_deadline_in_seconds has passed, whichever comes first.
 
-            self.consumer.commit()
+                self.uncommitted_messages += 1
+                if self.uncommitted_messages >= self.commit_batch_size or time.monotonic() - self.last_commit > self.commit_deadline_in_seconds:
+                    self.consumer.commit(asynchronous=True)
+                    self.uncommitted_messages = 0
+                    self.last_commit = time.monotonic()
 
         # Being outside of "while True", the following won't be executed.
         # But it is good form to close resources.
@@ -1920,11 +2419,14 @@ class InputKafkaMixin():
 class InputRabbitmqMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "InputRabbitmqMixin"))
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "InputRabbitmqMixin"))
 
-        # Create qn internal queue for this mixin.
+        # Create qn internal queue for this mixin.  The bound acts as a
+        # high-water mark that applies backpressure to the subscriber
+        # thread.
 
-        self.input_rabbitmq_mixin_queue = queue.Queue()
+        self.input_rabbitmq_mixin_queue = InternalQueue(maxsize=self.config.get('queue_maxsize'))
 
         threads = []
 
@@ -1951,6 +2453,7 @@ class InputRabbitmqMixin():
 
         for thread in threads:
             thread.start()
+        super().__init__(*args, **kwargs)
 
     def redo_records(self):
         '''
@@ -1960,9 +2463,9 @@ class InputRabbitmqMixin():
         '''
         while True:
             message, delivery_tag = self.input_rabbitmq_mixin_queue.get()
-            logging.debug(message_debug(918, threading.current_thread().name, "RabbitMQ", message))
-            assert isinstance(message, str)
-            self.config['received_from_redo_queue'] += 1
+            if debug_logging_enabled():
+                logging.debug(message_debug(918, threading.current_thread().name, "RabbitMQ", message))
+            self.counters['received_from_redo_queue'] += 1
             yield message, delivery_tag
 
     def acknowledge_read_message(self, delivery_tag):
@@ -1976,20 +2479,26 @@ class InputRabbitmqMixin():
 class InputSqsMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "InputSqsMixin"))
+        load_boto3()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "InputSqsMixin"))
         self.queue_url = self.config.get("sqs_redo_queue_url")
 
         # Create sqs object.
         # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sqs.html
         # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/core/session.html
 
-        regular_expression = "^([^/]+://[^/]+)/"
-        regex = re.compile(regular_expression)
-        match = regex.match(self.queue_url)
-        if not match:
-            exit_error(750, self.queue_url)
-        endpoint_url = match.group(1)
-        self.sqs = boto3.client("sqs", endpoint_url=endpoint_url)
+        self.sqs = get_sqs_client(get_sqs_endpoint_url(self.queue_url))
+
+        # Buffer acknowledgements so deletes go out in batches of up to
+        # 10 (the SQS maximum) instead of one HTTPS round-trip each.
+        # Each mixin instance is driven by a single thread, so the
+        # buffer needs no locking.
+
+        self.ack_buffer = []
+        self.ack_flush_deadline_in_seconds = 5
+        self.last_ack_flush = time.monotonic()
+        super().__init__(*args, **kwargs)
 
     def redo_records(self):
         '''
@@ -1999,12 +2508,14 @@ class InputSqsMixin():
 
         while True:
 
-            # Get message from AWS SQS queue.
+            # Get messages from AWS SQS queue.  Fetching the SQS maximum
+            # of 10 per call amortizes the HTTPS round-trip over the
+            # whole batch instead of paying it per record.
 
             sqs_response = self.sqs.receive_message(
                 QueueUrl=self.queue_url,
                 AttributeNames=[],
-                MaxNumberOfMessages=1,
+                MaxNumberOfMessages=10,
                 MessageAttributeNames=[],
                 VisibilityTimeout=30,
                 WaitTimeSeconds=20
@@ -2017,30 +2528,45 @@ class InputSqsMixin():
             sqs_messages = sqs_response.get("Messages", [])
             if not sqs_messages:
                 logging.info(message_info(190, self.queue_url))
+                self.flush_acknowledgements()
                 continue
 
-            # Construct and verify SQS message.
+            # Construct and verify SQS messages.
+            # As a generator, give each value to the co-routine.
 
-            sqs_message = sqs_messages[0]
-            sqs_message_body = sqs_message.get("Body")
-            sqs_message_receipt_handle = sqs_message.get("ReceiptHandle")
-            self.config['received_from_redo_queue'] += 1
+            for sqs_message in sqs_messages:
+                sqs_message_body = sqs_message.get("Body")
+                sqs_message_receipt_handle = sqs_message.get("ReceiptHandle")
+                self.counters['received_from_redo_queue'] += 1
+                if debug_logging_enabled():
+                    logging.debug(message_debug(918, threading.current_thread().name, "SQS", sqs_message_body))
+                yield sqs_message_body, sqs_message_receipt_handle
 
-            # As a generator, give the value to the co-routine.
+    def acknowledge_read_message(self, delivery_tag):
+        '''
+        Tell AWS SQS we're done with message.  Deletes are coalesced
+        into delete_message_batch() calls of up to 10; a partial batch
+        is flushed once it has been pending longer than
+        ack_flush_deadline_in_seconds, staying well inside the
+        30-second visibility timeout.
+        '''
 
-            logging.debug(message_debug(918, threading.current_thread().name, "SQS", sqs_message_body))
-            assert isinstance(sqs_message_body, str)
-            yield sqs_message_body, sqs_message_receipt_handle
+        self.ack_buffer.append(delivery_tag)
+        if len(self.ack_buffer) >= 10 or time.monotonic() - self.last_ack_flush > self.ack_flush_deadline_in_seconds:
+            self.flush_acknowledgements()
 
-    def acknowledge_read_message(self, delivery_tag):
+    def flush_acknowledgements(self):
         '''
-        Tell AWS SQS we're done with message.
+        Delete all buffered messages with a single batch call.
         '''
 
-        self.sqs.delete_message(
-            QueueUrl=self.queue_url,
-            ReceiptHandle=delivery_tag
-        )
+        if self.ack_buffer:
+            self.sqs.delete_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[{"Id": str(index), "ReceiptHandle": receipt_handle} for index, receipt_handle in enumerate(self.ack_buffer)]
+            )
+            self.ack_buffer = []
+        self.last_ack_flush = time.monotonic()
 
 # =============================================================================
 # Mixins: Execute*
@@ -2063,7 +2589,9 @@ class InputSqsMixin():
 class ExecuteMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "ExecuteMixin"))
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "ExecuteMixin"))
+        super().__init__(*args, **kwargs)
 
     def process_redo_record(self, redo_record=None):
         '''
@@ -2072,40 +2600,46 @@ class ExecuteMixin():
         The method can be sub-classed to call other G2Engine methods.
         '''
 
-        logging.debug(message_debug(919, threading.current_thread().name, redo_record))
-        assert isinstance(redo_record, str)
+        thread_name = threading.current_thread().name
+
+        if isinstance(redo_record, bytes):
+            redo_record = redo_record.decode()
 
         # Call g2_engine.process() and handle "edge" cases.
 
         try:
-            logging.debug(message_debug(910, threading.current_thread().name, redo_record))
+            if debug_logging_enabled():
+                logging.debug(message_debug(910, thread_name, redo_record))
             self.g2_engine.process(redo_record)
-            logging.debug(message_debug(911, threading.current_thread().name, redo_record))
+            if debug_logging_enabled():
+                logging.debug(message_debug(911, thread_name, redo_record))
 
-            self.config['processed_redo_records'] += 1
+            self.counters['processed_redo_records'] += 1
 
         except G2ModuleNotInitialized as err:
-            exit_error(707, threading.current_thread().name, err, redo_record)
+            exit_error(707, thread_name, err, redo_record)
         except Exception as err:
             # OT-TODO: replace this error handling in the future when G2 throws dedicated
             # failed connection exception.
 
             logging.error(message_error(830, redo_record, err))
             if is_db_connection_error(str(err)):
-                logging.warning(message_warning(710, threading.current_thread().name, err))
+                logging.warning(message_warning(710, thread_name, err))
                 return False
             if self.is_g2_default_configuration_changed():
                 self.update_active_g2_configuration()
-                logging.debug(message_debug(906, threading.current_thread().name, redo_record))
+                if debug_logging_enabled():
+                    logging.debug(message_debug(906, thread_name, redo_record))
                 try:
                     self.g2_engine.process(redo_record)
                 except Exception as err:
                     logging.error(message_error(831, redo_record, err))
                     raise err
-                logging.debug(message_debug(911, threading.current_thread().name, redo_record))
-                self.config['processed_redo_records'] += 1
+                if debug_logging_enabled():
+                    logging.debug(message_debug(911, thread_name, redo_record))
+                self.counters['processed_redo_records'] += 1
             else:
-                exit_error(709, threading.current_thread().name, err)
+                exit_error(709, thread_name, err)
 
         return True
 
@@ -2117,54 +2651,68 @@ class ExecuteMixin():
 class ExecuteWithInfoMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWithInfoMixin"))
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWithInfoMixin"))
         self.g2_engine_flags = 0
 
+        # The bytearray is allocated once and refilled by processWithInfo()
+        # on every call, avoiding an alloc/free cycle per record.
+
+        self.info_bytearray = bytearray()
+        super().__init__(*args, **kwargs)
+
     def process_redo_record(self, redo_record=None):
         '''
         Process a single Senzing redo record.
         This method uses G2Engine.processWithInfo()
         '''
 
-        logging.debug(message_debug(919, threading.current_thread().name, redo_record))
-        assert isinstance(redo_record, str)
+        thread_name = threading.current_thread().name
+
+        if isinstance(redo_record, bytes):
+            redo_record = redo_record.decode()
 
         # Additional parameters for processWithInfo().
 
-        info_bytearray = bytearray()
+        info_bytearray = self.info_bytearray
+        info_bytearray.clear()
 
         # Call g2_engine.processWithInfo() and handle "edge" cases.
 
         try:
-            logging.debug(message_debug(913, threading.current_thread().name, redo_record))
+            if debug_logging_enabled():
+                logging.debug(message_debug(913, thread_name, redo_record))
             self.g2_engine.processWithInfo(redo_record, info_bytearray, self.g2_engine_flags)
-            logging.debug(message_debug(914, threading.current_thread().name, redo_record, info_bytearray))
+            if debug_logging_enabled():
+                logging.debug(message_debug(914, thread_name, redo_record, info_bytearray))
 
-            self.config['processed_redo_records'] += 1
+            self.counters['processed_redo_records'] += 1
 
         except G2ModuleNotInitialized as err:
             self.send_to_failure_queue(redo_record)
-            exit_error(707, threading.current_thread().name, err, info_bytearray.decode())
+            exit_error(707, thread_name, err, info_bytearray.decode())
         except Exception as err:
             # OT-TODO: replace this error handling in the future when G2 throws dedicated
             # failed connection exception.
             logging.error(message_error(832, redo_record, err))
             if is_db_connection_error(str(err)):
-                logging.warning(message_warning(710, threading.current_thread().name, err))
+                logging.warning(message_warning(710, thread_name, err))
                 return False
             if self.is_g2_default_configuration_changed():
                 self.update_active_g2_configuration()
-                logging.debug(message_debug(906, threading.current_thread().name, redo_record))
+                if debug_logging_enabled():
+                    logging.debug(message_debug(906, thread_name, redo_record))
                 try:
                     self.g2_engine.processWithInfo(redo_record, info_bytearray, self.g2_engine_flags)
                 except Exception as err:
                     logging.error(message_error(833, redo_record, err))
                     raise err
-                logging.debug(message_debug(914, threading.current_thread().name, redo_record, info_bytearray))
-                self.config['processed_redo_records'] += 1
+                if debug_logging_enabled():
+                    logging.debug(message_debug(914, thread_name, redo_record, info_bytearray))
+                self.counters['processed_redo_records'] += 1
             else:
                 self.send_to_failure_queue(redo_record)
-                exit_error(709, threading.current_thread().name, err)
+                exit_error(709, thread_name, err)
 
         info_json = info_bytearray.decode()
 
@@ -2187,14 +2735,17 @@ class ExecuteWithInfoMixin():
 class ExecuteWriteToAzureQueueMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWriteToAzureQueueMixin"))
+        load_azure_servicebus()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWriteToAzureQueueMixin"))
         connection_string = self.config.get("azure_queue_connection_string")
         queue_name = self.config.get("azure_queue_name")
 
         # Create objects.
 
-        servicebus_client = ServiceBusClient.from_connection_string(connection_string)
+        servicebus_client = get_servicebus_client(connection_string)
         self.sender = servicebus_client.get_queue_sender(queue_name=queue_name)
+        super().__init__(*args, **kwargs)
 
     def process_redo_record(self, redo_record=None):
         '''
@@ -2202,12 +2753,12 @@ class ExecuteWriteToAzureQueueMixin():
         Simply send to AWS SQS.
         '''
 
-        logging.debug(message_debug(919, threading.current_thread().name, redo_record))
-        assert isinstance(redo_record, str)
+        if debug_logging_enabled():
+            logging.debug(message_debug(919, threading.current_thread().name, redo_record))
 
         service_bus_message = ServiceBusMessage(redo_record)
         self.sender.send_messages(service_bus_message)
-        self.config['sent_to_redo_queue'] += 1
+        self.counters['sent_to_redo_queue'] += 1
 
         return True
 
@@ -2219,7 +2770,9 @@ class ExecuteWriteToAzureQueueMixin():
 class ExecuteWriteToKafkaMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWriteToKafkaMixin"))
+        load_confluent_kafka()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWriteToKafkaMixin"))
 
         kafka_redo_bootstrap_server = self.config.get('kafka_redo_bootstrap_server')
         self.kafka_redo_topic = self.config.get('kafka_redo_topic')
@@ -2228,16 +2781,28 @@ class ExecuteWriteToKafkaMixin():
 
         kafka_producer_configuration = {
             'bootstrap.servers': kafka_redo_bootstrap_server,
+            'acks': self.config.get('kafka_acks'),
+            'batch.size': self.config.get('kafka_batch_size'),
+            'compression.type': self.config.get('kafka_compression'),
+            'linger.ms': self.config.get('kafka_linger_ms'),
         }
         self.kafka_producer = confluent_kafka.Producer(kafka_producer_configuration)
 
+        # Delivery reports are served by a dedicated daemon thread so the
+        # produce path never has to poll; in-flight messages are flushed
+        # at interpreter shutdown.
+
+        poll_thread = threading.Thread(target=poll_kafka_producer, args=(self.kafka_producer,))
+        poll_thread.daemon = True
+        poll_thread.start()
+        atexit.register(self.kafka_producer.flush, 10)
+        super().__init__(*args, **kwargs)
+
     def on_kafka_delivery(self, error, message):
-        message_topic = message.topic()
-        message_value = message.value()
-        message_error = message.error()
-        logging.debug(message_debug(103, threading.current_thread().name, message_topic, message_value, message_error, error))
         if error is not None:
-            logging.warning(message_warning(408, threading.current_thread().name, message_topic, message_value, message_error, error))
+            logging.warning(message_warning(408, threading.current_thread().name, message.topic(), message.value(), message.error(), error))
+        elif debug_logging_enabled():
+            logging.debug(message_debug(103, threading.current_thread().name, message.topic(), message.value(), message.error(), error))
 
     def process_redo_record(self, redo_record=None):
         '''
@@ -2245,25 +2810,34 @@ class ExecuteWriteToKafkaMixin():
         Simply send to Kafka.
         '''
 
-        logging.debug(message_debug(916, threading.current_thread().name, self.kafka_redo_topic, redo_record))
-        assert isinstance(redo_record, str)
+        thread_name = threading.current_thread().name
+
+        if debug_logging_enabled():
+            logging.debug(message_debug(916, thread_name, self.kafka_redo_topic, redo_record))
 
         load_succeeded = True
 
         try:
-            self.kafka_producer.produce(self.kafka_redo_topic, redo_record, on_delivery=self.on_kafka_delivery)
-            self.config['sent_to_redo_queue'] += 1
-        except BufferError as err:
-            logging.warning(message_warning(404, threading.current_thread().name, self.kafka_redo_topic, err, redo_record))
-            load_succeeded = False
+
+            # A full internal producer queue applies backpressure: block
+            # in poll() until librdkafka frees space instead of dropping
+            # the record.
+
+            while True:
+                try:
+                    self.kafka_producer.produce(self.kafka_redo_topic, redo_record, on_delivery=self.on_kafka_delivery)
+                    break
+                except BufferError:
+                    self.kafka_producer.poll(0.5)
+            self.counters['sent_to_redo_queue'] += 1
         except confluent_kafka.KafkaException as err:
-            logging.warning(message_warning(405, threading.current_thread().name, self.kafka_redo_topic, err, redo_record))
+            logging.warning(message_warning(405, thread_name, self.kafka_redo_topic, err, redo_record))
             load_succeeded = False
         except NotImplementedError as err:
-            logging.warning(message_warning(406, threading.current_thread().name, self.kafka_redo_topic, err, redo_record))
+            logging.warning(message_warning(406, thread_name, self.kafka_redo_topic, err, redo_record))
             load_succeeded = False
         except Exception as err:
-            logging.warning(message_warning(407, threading.current_thread().name, self.kafka_redo_topic, err, redo_record))
+            logging.warning(message_warning(407, thread_name, self.kafka_redo_topic, err, redo_record))
             load_succeeded = False
 
         return load_succeeded
@@ -2276,7 +2850,8 @@ class ExecuteWriteToKafkaMixin():
 class ExecuteWriteToRabbitmqMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWriteToRabbitmqMixin"))
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWriteToRabbitmqMixin"))
 
         self.execute_write_to_rabbitmq_mixin_rabbitmq = Rabbitmq(
             username=self.config.get("rabbitmq_redo_username"),
@@ -2289,18 +2864,20 @@ class ExecuteWriteToRabbitmqMixin():
             routing_key=self.config.get("rabbitmq_redo_routing_key"),
             passive=self.config.get("rabbitmq_use_existing_entities"),
         )
+        super().__init__(*args, **kwargs)
 
     def process_redo_record(self, redo_record=None):
         '''
         Process a single Senzing redo record.
-        Simply send to RabbitMQ.
+        Simply send to RabbitMQ.  Bytes records pass through undecoded;
+        Rabbitmq.send() publishes them as-is.
         '''
 
-        logging.debug(message_debug(919, threading.current_thread().name, redo_record))
-        assert isinstance(redo_record, str)
+        if debug_logging_enabled():
+            logging.debug(message_debug(919, threading.current_thread().name, redo_record))
 
         self.execute_write_to_rabbitmq_mixin_rabbitmq.send(redo_record)
-        self.config['sent_to_redo_queue'] += 1
+        self.counters['sent_to_redo_queue'] += 1
 
         return True
 
@@ -2312,20 +2889,17 @@ class ExecuteWriteToRabbitmqMixin():
 class ExecuteWriteToSqsMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWriteToSqsMixin"))
+        load_boto3()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "ExecuteWriteToSqsMixin"))
         self.queue_url = self.config.get("sqs_redo_queue_url")
 
         # Create sqs object.
         # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sqs.html
         # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/core/session.html
 
-        regular_expression = "^([^/]+://[^/]+)/"
-        regex = re.compile(regular_expression)
-        match = regex.match(self.queue_url)
-        if not match:
-            exit_error(750, self.queue_url)
-        endpoint_url = match.group(1)
-        self.sqs = boto3.client("sqs", endpoint_url=endpoint_url)
+        self.sqs = get_sqs_client(get_sqs_endpoint_url(self.queue_url))
+        super().__init__(*args, **kwargs)
 
     def process_redo_record(self, redo_record=None):
         '''
@@ -2333,8 +2907,10 @@ class ExecuteWriteToSqsMixin():
         Simply send to AWS SQS.
         '''
 
-        logging.debug(message_debug(919, threading.current_thread().name, redo_record))
-        assert isinstance(redo_record, str)
+        if debug_logging_enabled():
+            logging.debug(message_debug(919, threading.current_thread().name, redo_record))
+        if isinstance(redo_record, bytes):
+            redo_record = redo_record.decode()
 
         response = self.sqs.send_message(
             QueueUrl=self.queue_url,
@@ -2342,7 +2918,7 @@ class ExecuteWriteToSqsMixin():
             MessageAttributes={},
             MessageBody=(redo_record),
         )
-        self.config['sent_to_redo_queue'] += 1
+        self.counters['sent_to_redo_queue'] += 1
 
         return True
 
@@ -2352,6 +2928,7 @@ class ExecuteWriteToSqsMixin():
 #   - send_to_failure_queue(message)
 #   - send_to_info_queue(message)
 #   Classes:
+#   - OutputDrainMixin - Shared hand-off queue and drain thread
 #   - OutputAzureQueueMixin - Send to Azure queue
 #   - OutputInternalMixin - Send to log
 #   - OutputKafkaMixin - Send to Kafka
@@ -2359,16 +2936,105 @@ class ExecuteWriteToSqsMixin():
 #   - OutputSqsMixin - Send to AWS SQS
 # =============================================================================
 
+# -----------------------------------------------------------------------------
+# Class: OutputDrainMixin
+# -----------------------------------------------------------------------------
+
+
+class OutputDrainMixin():
+    '''
+    Shared machinery for the network output mixins.  A concrete mixin
+    sets self.failure_destination and self.info_destination, calls
+    start_output_drain_thread() from its __init__(), and implements
+    send_message_batch(); the bounded hand-off queue, the linger/flush
+    loop, and the public send_to_*_queue() entry points live here once.
+    '''
+
+    # Flush a buffered batch at this size or after the linger window.
+
+    output_batch_size = 50
+    output_linger_in_seconds = 0.02
+
+    # A failing downstream send is retried with exponential backoff and
+    # then ends the process.  The drain thread is a daemon the monitor
+    # does not track, so letting an exception kill it would silently
+    # leave workers blocked on a full hand-off queue.
+
+    output_send_retry_limit = 10
+    output_send_backoff_in_seconds = 1
+
+    def start_output_drain_thread(self):
+
+        # Sends are queued here and drained by a dedicated daemon thread
+        # so G2 processing is not blocked by output round-trips.
+
+        self.output_queue = queue.Queue(maxsize=10000)
+        self.output_queue_put = self.output_queue.put
+        self.output_thread = threading.Thread(target=self.drain_output_queue)
+        self.output_thread.daemon = True
+        self.output_thread.start()
+
+    def drain_output_queue(self):
+        '''
+        Forward queued messages downstream in batches via
+        send_message_batch().  Runs on a dedicated daemon thread; all
+        buffer state is confined to it.
+        '''
+
+        buffers = {}
+        while True:
+            try:
+                destination, counter_key, message = self.output_queue.get(timeout=self.output_linger_in_seconds)
+            except queue.Empty:
+                for destination, (counter_key, messages) in buffers.items():
+                    self.send_message_batch_with_retries(destination, counter_key, messages)
+                buffers.clear()
+                continue
+
+            entry = buffers.setdefault(destination, (counter_key, []))
+            entry[1].append(message)
+            if len(entry[1]) >= self.output_batch_size:
+                self.send_message_batch_with_retries(destination, counter_key, entry[1])
+                del buffers[destination]
+
+    def send_message_batch_with_retries(self, destination, counter_key, messages):
+        '''
+        Call send_message_batch(), retrying a failed send with
+        exponential backoff.  A batch that still cannot be sent after
+        output_send_retry_limit attempts ends the process via
+        exit_error_program(), so a broken broker surfaces as a crash
+        instead of a silently dead drain thread.
+        '''
+
+        backoff_in_seconds = self.output_send_backoff_in_seconds
+        for attempt in range(1, self.output_send_retry_limit + 1):
+            try:
+                self.send_message_batch(destination, counter_key, messages)
+                return
+            except Exception as err:
+                logging.warning(message_warning(416, threading.current_thread().name, counter_key, attempt, err))
+                time.sleep(backoff_in_seconds)
+                backoff_in_seconds = min(backoff_in_seconds * 2, 60)
+        exit_error_program(751, threading.current_thread().name, counter_key, self.output_send_retry_limit)
+
+    def send_to_failure_queue(self, message):
+        self.output_queue_put((self.failure_destination, 'sent_to_failure_queue', message))
+
+    def send_to_info_queue(self, message):
+        self.output_queue_put((self.info_destination, 'sent_to_info_queue', message))
+
 # -----------------------------------------------------------------------------
 # Class: OutputAzureQueueMixin
 # -----------------------------------------------------------------------------
 
 
-class OutputAzureQueueMixin():
+class OutputAzureQueueMixin(OutputDrainMixin):
     ''' This is a "null object". '''
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "OutputAzureQueueMixin"))
+        load_azure_servicebus()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "OutputAzureQueueMixin"))
         failure_connection_string = self.config.get("azure_failure_connection_string")
         failure_queue_name = self.config.get("azure_failure_queue_name")
         info_connection_string = self.config.get("azure_info_connection_string")
@@ -2376,22 +3042,65 @@ class OutputAzureQueueMixin():
 
         # Create objects.
 
-        failure_servicebus_client = ServiceBusClient.from_connection_string(failure_connection_string)
-        self.failure_sender = failure_servicebus_client.get_queue_sender(queue_name=failure_queue_name)
-        info_servicebus_client = ServiceBusClient.from_connection_string(info_connection_string)
-        self.failure_sender = info_servicebus_client.get_queue_sender(queue_name=info_queue_name)
+        failure_servicebus_client = get_servicebus_client(failure_connection_string)
+        self.failure_destination = failure_servicebus_client.get_queue_sender(queue_name=failure_queue_name)
+        info_servicebus_client = get_servicebus_client(info_connection_string)
+        self.info_destination = info_servicebus_client.get_queue_sender(queue_name=info_queue_name)
+        self.start_output_drain_thread()
+        super().__init__(*args, **kwargs)
 
-    def send_to_failure_queue(self, message):
-        assert isinstance(message, str)
-        service_bus_message = ServiceBusMessage(message)
-        self.failure_sender.send_messages(service_bus_message)
-        self.config['sent_to_failure_queue'] += 1
+    output_batch_size = 100
 
-    def send_to_info_queue(self, message):
-        assert isinstance(message, str)
-        service_bus_message = ServiceBusMessage(message)
-        self.finfo_sender.send_messages(service_bus_message)
-        self.config['sent_to_info_queue'] += 1
+    def drain_output_queue(self):
+        '''
+        Forward queued messages downstream in Service Bus batches, so one
+        AMQP frame carries up to output_batch_size messages.  Overrides
+        the base loop because ServiceBusMessageBatch enforces the
+        broker's byte limit while messages are added.  Runs on a
+        dedicated daemon thread; all batch state is confined to it.
+        '''
+
+        pending_batches = {}
+        while True:
+            try:
+                sender, counter_key, message = self.output_queue.get(timeout=self.output_linger_in_seconds)
+            except queue.Empty:
+                for sender, (counter_key, batch) in pending_batches.items():
+                    self.send_message_batch_with_retries(sender, counter_key, batch)
+                pending_batches.clear()
+                continue
+
+            entry = pending_batches.get(sender)
+            if entry is None:
+                entry = pending_batches[sender] = (counter_key, sender.create_message_batch())
+            try:
+                entry[1].add_message(ServiceBusMessage(message))
+            except ValueError:
+
+                # Batch reached the broker's byte limit.  Send it and start
+                # a new one holding this message.
+
+                self.send_message_batch_with_retries(sender, counter_key, entry[1])
+                entry = pending_batches[sender] = (counter_key, sender.create_message_batch())
+                try:
+                    entry[1].add_message(ServiceBusMessage(message))
+                except ValueError:
+
+                    # The message alone exceeds the limit, so it fails on
+                    # every re-add.  Drop it, as SQS sender faults are
+                    # dropped, so the drain thread survives.
+
+                    logging.warning(message_warning(418, threading.current_thread().name, message))
+                    del pending_batches[sender]
+                    continue
+            if len(entry[1]) >= self.output_batch_size:
+                self.send_message_batch_with_retries(sender, counter_key, entry[1])
+                del pending_batches[sender]
+
+    def send_message_batch(self, sender, counter_key, batch):
+        if len(batch) > 0:
+            sender.send_messages(batch)
+            self.counters[counter_key] += len(batch)
 
 # -----------------------------------------------------------------------------
 # Class: OutputInternalMixin
@@ -2402,17 +3111,17 @@ class OutputInternalMixin():
     ''' This is a "null object". '''
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "OutputInternalMixin"))
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "OutputInternalMixin"))
+        super().__init__(*args, **kwargs)
 
     def send_to_failure_queue(self, message):
         logging.info(message_info(121, threading.current_thread().name, message))
-        assert isinstance(message, str)
-        self.config['sent_to_failure_queue'] += 1
+        self.counters['sent_to_failure_queue'] += 1
 
     def send_to_info_queue(self, message):
         logging.info(message_info(128, threading.current_thread().name, message))
-        assert isinstance(message, str)
-        self.config['sent_to_info_queue'] += 1
+        self.counters['sent_to_info_queue'] += 1
 
 # -----------------------------------------------------------------------------
 # Class: OutputKafkaMixin
@@ -2422,13 +3131,28 @@ class OutputInternalMixin():
 class OutputKafkaMixin():
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "OutputKafkaMixin"))
+        load_confluent_kafka()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "OutputKafkaMixin"))
+
+        # Producer tuning shared by both queues: larger compressed batches
+        # and bounded internal buffering.
+
+        kafka_tuning_configuration = {
+            'acks': self.config.get('kafka_acks'),
+            'batch.size': self.config.get('kafka_batch_size'),
+            'compression.type': self.config.get('kafka_compression'),
+            'linger.ms': self.config.get('kafka_linger_ms'),
+            'queue.buffering.max.messages': 200000,
+            'queue.buffering.max.kbytes': 1048576,
+        }
 
         # Kafka configuration for failure queuing.
 
         self.kafka_failure_topic = self.config.get('kafka_failure_topic')
         kafka_producer_configuration = {
             'bootstrap.servers': self.config.get('kafka_failure_bootstrap_server'),
+            **kafka_tuning_configuration,
         }
         self.kafka_failure_producer = confluent_kafka.Producer(kafka_producer_configuration)
 
@@ -2437,25 +3161,46 @@ class OutputKafkaMixin():
         self.kafka_info_topic = self.config.get('kafka_info_topic')
         kafka_producer_configuration = {
             'bootstrap.servers': self.config.get('kafka_info_bootstrap_server'),
+            **kafka_tuning_configuration,
         }
         self.kafka_info_producer = confluent_kafka.Producer(kafka_producer_configuration)
 
+        # Delivery reports are served by a dedicated daemon thread per
+        # producer, so the produce path never has to poll; in-flight
+        # messages are flushed at interpreter shutdown.
+
+        for kafka_producer in (self.kafka_failure_producer, self.kafka_info_producer):
+            poll_thread = threading.Thread(target=poll_kafka_producer, args=(kafka_producer,))
+            poll_thread.daemon = True
+            poll_thread.start()
+            atexit.register(kafka_producer.flush, 10)
+        super().__init__(*args, **kwargs)
+
     def on_kafka_delivery(self, error, message):
-        message_topic = message.topic()
-        message_value = message.value()
-        message_error = message.error()
-        logging.debug(message_debug(103, threading.current_thread().name, message_topic, message_value, message_error, error))
         if error is not None:
-            logging.warning(message_warning(408, threading.current_thread().name, message_topic, message_value, message_error, error))
+            logging.warning(message_warning(408, threading.current_thread().name, message.topic(), message.value(), message.error(), error))
+        elif debug_logging_enabled():
+            logging.debug(message_debug(103, threading.current_thread().name, message.topic(), message.value(), message.error(), error))
+
+    def produce(self, kafka_producer, topic, message):
+        '''
+        Produce one message.  A full local queue blocks in poll() until
+        librdkafka frees space instead of dropping the message.
+        '''
+
+        while True:
+            try:
+                kafka_producer.produce(topic, message, on_delivery=self.on_kafka_delivery)
+                return
+            except BufferError:
+                kafka_producer.poll(1.0)
 
     def send_to_failure_queue(self, message):
-        logging.debug(message_debug(916, threading.current_thread().name, self.kafka_failure_topic, message))
-        assert isinstance(message, str)
+        if debug_logging_enabled():
+            logging.debug(message_debug(916, threading.current_thread().name, self.kafka_failure_topic, message))
         try:
-            self.kafka_failure_producer.produce(self.kafka_failure_topic, message, on_delivery=self.on_kafka_delivery)
-            self.config['sent_to_failure_queue'] += 1
-        except BufferError as err:
-            logging.warning(message_warning(404, threading.current_thread().name, self.kafka_failure_topic, err, message))
+            self.produce(self.kafka_failure_producer, self.kafka_failure_topic, message)
+            self.counters['sent_to_failure_queue'] += 1
         except confluent_kafka.KafkaException as err:
             logging.warning(message_warning(405, threading.current_thread().name, self.kafka_failure_topic, err, message))
         except NotImplementedError as err:
@@ -2464,13 +3209,11 @@ class OutputKafkaMixin():
             logging.warning(message_warning(407, threading.current_thread().name, self.kafka_failure_topic, err, message))
 
     def send_to_info_queue(self, message):
-        logging.debug(message_debug(916, threading.current_thread().name, self.kafka_info_topic, message))
-        assert isinstance(message, str)
+        if debug_logging_enabled():
+            logging.debug(message_debug(916, threading.current_thread().name, self.kafka_info_topic, message))
         try:
-            self.kafka_info_producer.produce(self.kafka_info_topic, message, on_delivery=self.on_kafka_delivery)
-            self.config['sent_to_info_queue'] += 1
-        except BufferError as err:
-            logging.warning(message_warning(404, threading.current_thread().name, self.kafka_info_topic, err, message))
+            self.produce(self.kafka_info_producer, self.kafka_info_topic, message)
+            self.counters['sent_to_info_queue'] += 1
         except confluent_kafka.KafkaException as err:
             logging.warning(message_warning(405, threading.current_thread().name, self.kafka_info_topic, err, message))
         except NotImplementedError as err:
@@ -2483,14 +3226,20 @@ class OutputKafkaMixin():
 # -----------------------------------------------------------------------------
 
 
-class OutputRabbitmqMixin():
+class OutputRabbitmqMixin(OutputDrainMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "OutputRabbitmqMixin"))
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "OutputRabbitmqMixin"))
+
+        # Both publishers are used by the drain thread only, so they can
+        # share one pooled connection and differ only by channel.
+
+        connection_pool = RabbitmqConnectionPool()
 
         # Connect to RabbitMQ for "info".
 
-        self.output_rabbitmq_mixin_info_rabbitmq = Rabbitmq(
+        self.info_destination = Rabbitmq(
             username=self.config.get("rabbitmq_info_username"),
             password=self.config.get("rabbitmq_info_password"),
             host=self.config.get("rabbitmq_info_host"),
@@ -2500,11 +3249,12 @@ class OutputRabbitmqMixin():
             heartbeat=self.config.get("rabbitmq_heartbeat_in_seconds"),
             routing_key=self.config.get("rabbitmq_info_routing_key"),
             passive=self.config.get("rabbitmq_use_existing_entities"),
+            pool=connection_pool,
         )
 
         # Connect to RabbitMQ for "failure".
 
-        self.output_rabbitmq_mixin_failure_rabbitmq = Rabbitmq(
+        self.failure_destination = Rabbitmq(
             username=self.config.get("rabbitmq_failure_username"),
             password=self.config.get("rabbitmq_failure_password"),
             host=self.config.get("rabbitmq_failure_host"),
@@ -2514,92 +3264,99 @@ class OutputRabbitmqMixin():
             heartbeat=self.config.get("rabbitmq_heartbeat_in_seconds"),
             routing_key=self.config.get("rabbitmq_failure_routing_key"),
             passive=self.config.get("rabbitmq_use_existing_entities"),
+            pool=connection_pool,
         )
 
-    def send_to_failure_queue(self, message):
-        assert isinstance(message, str)
-        self.output_rabbitmq_mixin_failure_rabbitmq.send(message)
-        self.config['sent_to_failure_queue'] += 1
+        self.start_output_drain_thread()
+        super().__init__(*args, **kwargs)
 
-    def send_to_info_queue(self, message):
-        assert isinstance(message, str)
-        self.output_rabbitmq_mixin_info_rabbitmq.send(message)
-        self.config['sent_to_info_queue'] += 1
+    def send_message_batch(self, rabbitmq, counter_key, messages):
+
+        # Batches publish back-to-back on the persistent channel.
+
+        if messages:
+            rabbitmq.send_batch(messages)
+            self.counters[counter_key] += len(messages)
 
 # -----------------------------------------------------------------------------
 # Class: OutputSqsMixin
 # -----------------------------------------------------------------------------
 
 
-class OutputSqsMixin():
+class OutputSqsMixin(OutputDrainMixin):
     ''' This is a "null object". '''
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "OutputInternalMixin"))
-        self.info_queue_url = self.config.get("sqs_info_queue_url")
-        self.failure_queue_url = self.config.get("sqs_failure_queue_url")
+        load_boto3()
+        if debug_logging_enabled():
+            logging.debug(message_debug(996, threading.current_thread().name, "OutputInternalMixin"))
+        self.info_destination = self.config.get("sqs_info_queue_url")
+        self.failure_destination = self.config.get("sqs_failure_queue_url")
 
         # Create sqs object.
         # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/services/sqs.html
         # https://boto3.amazonaws.com/v1/documentation/api/latest/reference/core/session.html
 
-        regular_expression = "^([^/]+://[^/]+)/"
-        regex = re.compile(regular_expression)
-        match = regex.match(self.info_queue_url)
-        if not match:
-            exit_error(750, self.info_queue_url)
-        endpoint_url = match.group(1)
-        self.sqs = boto3.client("sqs", endpoint_url=endpoint_url)
-
-    def send_to_failure_queue(self, message):
-        assert isinstance(message, str)
-        response = self.sqs.send_message(
-            QueueUrl=self.failure_queue_url,
-            DelaySeconds=10,
-            MessageAttributes={},
-            MessageBody=(message),
-        )
-        self.config['sent_to_failure_queue'] += 1
-
-    def send_to_info_queue(self, message):
-        assert isinstance(message, str)
-        response = self.sqs.send_message(
-            QueueUrl=self.info_queue_url,
-            DelaySeconds=10,
-            MessageAttributes={},
-            MessageBody=(message),
-        )
-        self.config['sent_to_info_queue'] += 1
-
-# =============================================================================
-# Mixins: Queue*
-#   Methods:
-#   - send_to_redo_queue(redo_record)
-#   Classes:
-#   - QueueInternalMixin - Send to internal queue
-# =============================================================================
-
-# -----------------------------------------------------------------------------
-# Class: QueueInternalMixin
-# -----------------------------------------------------------------------------
+        self.sqs = get_sqs_client(get_sqs_endpoint_url(self.info_destination))
+        self.start_output_drain_thread()
+        super().__init__(*args, **kwargs)
 
+    # SQS caps a batch request at ten entries.
 
-class QueueInternalMixin():
+    output_batch_size = 10
 
-    def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(996, threading.current_thread().name, "QueueInternalMixin"))
+    def send_message_batch(self, queue_url, counter_key, messages):
+        '''
+        Send one buffered batch, re-sending entries the batch call
+        reports as failed.  Failures are handled here rather than in
+        send_message_batch_with_retries() because a partial failure must
+        only re-send the failed entries, not the whole batch.
+        '''
 
-    def send_to_redo_queue(self, redo_record):
-        assert isinstance(redo_record, tuple)
-        self.redo_queue.put(redo_record)
+        backoff_in_seconds = self.output_send_backoff_in_seconds
+        attempt = 1
+        while messages:
+            if attempt > self.output_send_retry_limit:
+                exit_error_program(751, threading.current_thread().name, counter_key, self.output_send_retry_limit)
+            try:
+                response = self.sqs.send_message_batch(
+                    QueueUrl=queue_url,
+                    Entries=[{'Id': str(index), 'MessageBody': message} for index, message in enumerate(messages)],
+                )
+            except Exception as err:
+                logging.warning(message_warning(416, threading.current_thread().name, counter_key, attempt, err))
+                attempt += 1
+                time.sleep(backoff_in_seconds)
+                backoff_in_seconds = min(backoff_in_seconds * 2, 60)
+                continue
+            self.counters[counter_key] += len(response.get('Successful', []))
+            failed = response.get('Failed', [])
+            if not failed:
+                break
+
+            # A sender fault (oversized or malformed entry) fails on
+            # every re-send, so drop it.  Other entries are re-sent with
+            # backoff.
+
+            retryable = []
+            for entry in failed:
+                if entry.get('SenderFault'):
+                    logging.warning(message_warning(417, threading.current_thread().name, queue_url, entry))
+                else:
+                    logging.warning(message_warning(415, threading.current_thread().name, queue_url, entry))
+                    retryable.append(entry)
+            messages = [messages[int(entry['Id'])] for entry in retryable]
+            if messages:
+                attempt += 1
+                time.sleep(backoff_in_seconds)
+                backoff_in_seconds = min(backoff_in_seconds * 2, 60)
 
 # =============================================================================
-# Threads: Process*, Queue*
+# Threads: Process*
 #   Methods:
 #   - run
 #   Classes:
 #   - ProcessRedoQueueThread - Call process_redo_record(redo_record)
-#   - QueueRedoRecordsThread - Call send_to_redo_queue(redo_record)
 # =============================================================================
 
 # -----------------------------------------------------------------------------
@@ -2609,19 +3366,36 @@ class QueueInternalMixin():
 
 class ProcessRedoQueueThread(threading.Thread):
 
-    def __init__(self, config=None, g2_engine=None, g2_configuration_manager=None, redo_queue=None, governor=None):
+    def __init__(self, config=None, g2_engine=None, g2_configuration_manager=None, governor=None):
         threading.Thread.__init__(self)
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoQueueThread"))
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoQueueThread"))
         self.config = config
+        self.counters = dict.fromkeys(COUNTER_KEYS, 0)
         self.g2_configuration_manager = g2_configuration_manager
         self.g2_engine = g2_engine
         self.governor = governor
         self.info_filter = InfoFilter(g2_engine=g2_engine)
-        self.redo_queue = redo_queue
         self.senzing_sdk_version_major = config.get('senzing_sdk_version_major')
 
+        # Cache for is_g2_default_configuration_changed().  The default
+        # configuration rarely changes, so the ID fetched from the G2
+        # database is kept for a short interval; the bytearrays are
+        # allocated once and refilled on each check.
+
+        self.configuration_check_interval_in_seconds = 30
+        self.last_default_config_check = 0.0
+        self.cached_default_config_id = None
+        self.active_config_id_bytearray = bytearray()
+        self.default_config_id_bytearray = bytearray()
+
+        # Continue the cooperative chain past threading.Thread, which does
+        # not call super().__init__() itself, so the Input*/Execute*/
+        # Output* mixins later in the MRO initialize too.
+
+        super(threading.Thread, self).__init__()
+
     def filter_info_message(self, message=None):
-        assert isinstance(message, str)
         return self.info_filter.filter(message=message)
 
     def govern(self):
@@ -2636,7 +3410,8 @@ class ProcessRedoQueueThread(threading.Thread):
 
         # Get active Configuration ID being used by g2_engine.
 
-        active_config_id = bytearray()
+        active_config_id = self.active_config_id_bytearray
+        active_config_id.clear()
 
         try:
             self.g2_engine.getActiveConfigID(active_config_id)
@@ -2644,23 +3419,40 @@ class ProcessRedoQueueThread(threading.Thread):
             logging.error(message_error(801, err))
             raise err
 
-        # Get most current Configuration ID from G2 database.
-
-        default_config_id = bytearray()
-        try:
-            self.g2_configuration_manager.getDefaultConfigID(default_config_id)
+        # Get most current Configuration ID from G2 database.  A fresh
+        # cached default that already differs from the active ID proves a
+        # change without another DB round-trip: this is the thundering-
+        # herd case, where every worker checks at once right after a new
+        # default configuration is published.  An "unchanged" verdict is
+        # always confirmed against a fresh read, since the caller treats
+        # it as fatal.
+
+        now = time.monotonic()
+        if (
+            self.cached_default_config_id is not None
+            and now - self.last_default_config_check <= self.configuration_check_interval_in_seconds
+            and active_config_id != self.cached_default_config_id
+        ):
+            result = True
+        else:
+            default_config_id = self.default_config_id_bytearray
+            default_config_id.clear()
+            try:
+                self.g2_configuration_manager.getDefaultConfigID(default_config_id)
+                self.cached_default_config_id = bytes(default_config_id)
+                self.last_default_config_check = now
 
-            # Determine if configuration has changed.
+                # Determine if configuration has changed.
 
-            result = active_config_id != default_config_id
-        except Exception as err:
-            logging.error(message_error(802, err))
-            result = False
+                result = active_config_id != self.cached_default_config_id
+            except Exception as err:
+                logging.error(message_error(802, err))
+                result = False
 
         # Determine if configuration has changed.
 
         if result:
-            logging.info(message_info(292, active_config_id.decode(), default_config_id.decode()))
+            logging.info(message_info(292, active_config_id.decode(), self.cached_default_config_id.decode()))
 
         logging.debug(message_debug(951, sys._getframe().f_code.co_name))
         return result
@@ -2696,116 +3488,36 @@ class ProcessRedoQueueThread(threading.Thread):
 
         logging.info(message_info(129, threading.current_thread().name))
 
+        # Bind hot-path methods to locals so the per-record loop uses
+        # LOAD_FAST instead of repeated attribute lookups.
+
+        govern = self.govern
+        process_redo_record = self.process_redo_record
+        has_acknowledge_read_message = hasattr(self, 'acknowledge_read_message')
+
         # Process redo records.
 
         return_code = 0
         for redo_record, acknowledge_tag in self.redo_records():
-            logging.debug(message_debug(922, threading.current_thread().name, "After generator", redo_record))
+            if debug_logging_enabled():
+                logging.debug(message_debug(922, threading.current_thread().name, "After generator", redo_record))
 
             # Invoke Governor.
 
-            self.govern()
-            logging.debug(message_debug(922, threading.current_thread().name, "After govern()", redo_record))
+            govern()
+            if debug_logging_enabled():
+                logging.debug(message_debug(922, threading.current_thread().name, "After govern()", redo_record))
 
             # Process record based on the Mixin's process_redo_record() method.
 
-            process_succeeded = self.process_redo_record(redo_record)
-            logging.debug(message_debug(922, threading.current_thread().name, "After process_redo_record()", redo_record))
-
-            # Acnkowledge reading the message, if available.
-            if process_succeeded:
-                try:
-                    self.acknowledge_read_message(acknowledge_tag)
-                except AttributeError as err:
-                    pass
-
-        # Log message for thread exiting.
+            process_succeeded = process_redo_record(redo_record)
+            if debug_logging_enabled():
+                logging.debug(message_debug(922, threading.current_thread().name, "After process_redo_record()", redo_record))
 
-        logging.info(message_info(130, threading.current_thread().name))
-
-# -----------------------------------------------------------------------------
-# Class: QueueRedoRecordsThread
-# -----------------------------------------------------------------------------
+            # Acknowledge reading the message, if available.
 
-
-class QueueRedoRecordsThread(threading.Thread):
-
-    def __init__(self, config=None, g2_engine=None, redo_queue=None):
-        threading.Thread.__init__(self)
-        logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsThread"))
-        self.config = config
-        self.g2_engine = g2_engine
-        self.redo_queue = redo_queue
-
-    def redo_records(self):
-        '''A generator for producing Senzing redo records.'''
-
-        # Pull values from configuration.
-
-        redo_sleep_time_in_seconds = self.config.get('redo_sleep_time_in_seconds')
-        redo_retry_sleep_time_in_seconds = self.config.get('redo_retry_sleep_time_in_seconds')
-        redo_retry_limit = self.config.get('redo_retry_limit')
-
-        # Initialize variables.
-
-        redo_record_bytearray = bytearray()
-        return_code = 0
-        retry_count = 0
-
-        # Read forever.
-
-        while True:
-
-            # Read a Senzing redo record.
-
-            try:
-                logging.debug(message_debug(901, threading.current_thread().name))
-                return_code = self.g2_engine.getRedoRecord(redo_record_bytearray)
-            except G2ModuleNotInitialized as err:
-                exit_error(702, err, redo_record_bytearray.decode())
-            except Exception as err:
-                # OT-TODO: replace this error handling in the future when G2 throws dedicated
-                # failed connection exception.
-                logging.error(message_error(834, err))
-                if is_db_connection_error(str(err)) and retry_count < redo_retry_limit:
-                    retry_count += 1
-                    logging.warning(message_warning(704, err, redo_retry_sleep_time_in_seconds))
-                    time.sleep(redo_retry_sleep_time_in_seconds)
-                    continue
-                exit_error(703, err)
-            if return_code:
-                exit_error(701, return_code)
-
-            # Reset the retry count
-            retry_count = 0
-
-            # If redo record was not received, sleep and try again.
-
-            redo_record = redo_record_bytearray.decode()
-            if not redo_record:
-                logging.debug(message_debug(902, threading.current_thread().name, redo_sleep_time_in_seconds))
-                time.sleep(redo_sleep_time_in_seconds)
-                continue
-
-            # Return generator value.
-
-            logging.debug(message_debug(903, threading.current_thread().name, redo_record))
-            assert isinstance(redo_record, str)
-            self.config['redo_records_from_senzing_engine'] += 1
-            yield redo_record, None
-
-    def run(self):
-        '''Get redo records from Senzing.  Put redo records in internal queue.'''
-
-        # Show that thread is starting in the log.
-
-        logging.info(message_info(129, threading.current_thread().name))
-
-        # Transfer messages from Senzing to internal queue.
-
-        for redo_record in self.redo_records():
-            logging.debug(message_debug(904, threading.current_thread().name, redo_record))
-            self.send_to_redo_queue(redo_record)
+            if process_succeeded and has_acknowledge_read_message:
+                self.acknowledge_read_message(acknowledge_tag)
 
         # Log message for thread exiting.
 
@@ -2818,28 +3530,20 @@ class QueueRedoRecordsThread(threading.Thread):
 # ---- No external queue ------------------------------------------------------
 
 
-class ProcessRedoQueueInternalWithInfoThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWithInfoMixin, OutputInternalMixin):
+class ProcessRedoQueueInternalWithInfoThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWithInfoMixin, OutputInternalMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoQueueInternalWithInfoThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoQueueInternalWithInfoThread"))
+        super().__init__(*args, **kwargs)
 
 
-class ProcessRedoThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteMixin, OutputInternalMixin):
+class ProcessRedoThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteMixin, OutputInternalMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
-
-
-class QueueRedoRecordsInternalThread(QueueRedoRecordsThread, QueueInternalMixin):
-
-    def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsInternalThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoThread"))
+        super().__init__(*args, **kwargs)
 
 # ---- Azure Queue related ----------------------------------------------------
 
@@ -2847,33 +3551,33 @@ class QueueRedoRecordsInternalThread(QueueRedoRecordsThread, QueueInternalMixin)
 class ProcessReadFromAzureQueueThread(ProcessRedoQueueThread, InputAzureQueueMixin, ExecuteMixin, OutputInternalMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromAzureQueueThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromAzureQueueThread"))
+        super().__init__(*args, **kwargs)
 
 
 class ProcessReadFromAzureQueueWithinfoThread(ProcessRedoQueueThread, InputAzureQueueMixin, ExecuteWithInfoMixin, OutputAzureQueueMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromAzureQueueWithinfoThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromAzureQueueWithinfoThread"))
+        super().__init__(*args, **kwargs)
 
 
-class ProcessRedoWithinfoAzureQueueThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWithInfoMixin, OutputAzureQueueMixin):
+class ProcessRedoWithinfoAzureQueueThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWithInfoMixin, OutputAzureQueueMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoWithinfoAzureQueueThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoWithinfoAzureQueueThread"))
+        super().__init__(*args, **kwargs)
 
 
-class QueueRedoRecordsAzureQueueThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWriteToAzureQueueMixin):
+class QueueRedoRecordsAzureQueueThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWriteToAzureQueueMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsAzureQueueThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsAzureQueueThread"))
+        super().__init__(*args, **kwargs)
 
 # ---- Kafka related ----------------------------------------------------------
 
@@ -2881,33 +3585,33 @@ class QueueRedoRecordsAzureQueueThread(ProcessRedoQueueThread, InputInternalMixi
 class ProcessReadFromKafkaThread(ProcessRedoQueueThread, InputKafkaMixin, ExecuteMixin, OutputInternalMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromKafkaThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromKafkaThread"))
+        super().__init__(*args, **kwargs)
 
 
 class ProcessReadFromKafkaWithinfoThread(ProcessRedoQueueThread, InputKafkaMixin, ExecuteWithInfoMixin, OutputKafkaMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromKafkaWithinfoThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromKafkaWithinfoThread"))
+        super().__init__(*args, **kwargs)
 
 
-class ProcessRedoWithinfoKafkaThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWithInfoMixin, OutputKafkaMixin):
+class ProcessRedoWithinfoKafkaThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWithInfoMixin, OutputKafkaMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoWithinfoKafkaThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoWithinfoKafkaThread"))
+        super().__init__(*args, **kwargs)
 
 
-class QueueRedoRecordsKafkaThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWriteToKafkaMixin):
+class QueueRedoRecordsKafkaThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWriteToKafkaMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsKafkaThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsKafkaThread"))
+        super().__init__(*args, **kwargs)
 
 # ---- RabbitMQ related -------------------------------------------------------
 
@@ -2915,33 +3619,33 @@ class QueueRedoRecordsKafkaThread(ProcessRedoQueueThread, InputInternalMixin, Ex
 class ProcessReadFromRabbitmqThread(ProcessRedoQueueThread, InputRabbitmqMixin, ExecuteMixin, OutputInternalMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromRabbitmqThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromRabbitmqThread"))
+        super().__init__(*args, **kwargs)
 
 
 class ProcessReadFromRabbitmqWithinfoThread(ProcessRedoQueueThread, InputRabbitmqMixin, ExecuteWithInfoMixin, OutputRabbitmqMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromRabbitmqWithinfoThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromRabbitmqWithinfoThread"))
+        super().__init__(*args, **kwargs)
 
 
-class ProcessRedoWithinfoRabbitmqThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWithInfoMixin, OutputRabbitmqMixin):
+class ProcessRedoWithinfoRabbitmqThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWithInfoMixin, OutputRabbitmqMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoWithinfoRabbitmqThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoWithinfoRabbitmqThread"))
+        super().__init__(*args, **kwargs)
 
 
-class QueueRedoRecordsRabbitmqThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWriteToRabbitmqMixin):
+class QueueRedoRecordsRabbitmqThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWriteToRabbitmqMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsRabbitmqThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsRabbitmqThread"))
+        super().__init__(*args, **kwargs)
 
 # ---- AWS SQS related --------------------------------------------------------
 
@@ -2949,33 +3653,33 @@ class QueueRedoRecordsRabbitmqThread(ProcessRedoQueueThread, InputInternalMixin,
 class ProcessReadFromSqsThread(ProcessRedoQueueThread, InputSqsMixin, ExecuteMixin, OutputInternalMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromSqsThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromSqsThread"))
+        super().__init__(*args, **kwargs)
 
 
 class ProcessReadFromSqsWithinfoThread(ProcessRedoQueueThread, InputSqsMixin, ExecuteWithInfoMixin, OutputSqsMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromSqsWithinfoThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessReadFromSqsWithinfoThread"))
+        super().__init__(*args, **kwargs)
 
 
-class ProcessRedoWithinfoSqsThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWithInfoMixin, OutputSqsMixin):
+class ProcessRedoWithinfoSqsThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWithInfoMixin, OutputSqsMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoWithinfoSqsThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "ProcessRedoWithinfoSqsThread"))
+        super().__init__(*args, **kwargs)
 
 
-class QueueRedoRecordsSqsThread(ProcessRedoQueueThread, InputInternalMixin, ExecuteWriteToSqsMixin):
+class QueueRedoRecordsSqsThread(ProcessRedoQueueThread, InputG2EngineMixin, ExecuteWriteToSqsMixin):
 
     def __init__(self, *args, **kwargs):
-        logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsSqsThread"))
-        for base in type(self).__bases__:
-            base.__init__(self, *args, **kwargs)
+        if debug_logging_enabled():
+            logging.debug(message_debug(997, threading.current_thread().name, "QueueRedoRecordsSqsThread"))
+        super().__init__(*args, **kwargs)
 
 # -----------------------------------------------------------------------------
 # Utility functions
@@ -3012,25 +3716,30 @@ def entry_template(config):
     ''' Format of entry message. '''
     debug = config.get("debug", False)
     config['start_time'] = time.time()
+
+    # Elapsed time is measured on the monotonic clock, which NTP
+    # adjustments cannot move; start_time stays wall-clock for the log.
+
+    config['start_time_monotonic'] = time.monotonic()
     if debug:
         final_config = config
     else:
         final_config = redact_configuration(config)
-    config_json = json.dumps(final_config, sort_keys=True)
+    config_json = dump_json(final_config, sort_keys=True)
     return message_info(297, config_json)
 
 
 def exit_template(config):
     ''' Format of exit message. '''
     debug = config.get("debug", False)
-    stop_time = time.time()
-    config['stop_time'] = stop_time
-    config['elapsed_time'] = stop_time - config.get('start_time', stop_time)
+    stop_time_monotonic = time.monotonic()
+    config['stop_time'] = time.time()
+    config['elapsed_time'] = stop_time_monotonic - config.get('start_time_monotonic', stop_time_monotonic)
     if debug:
         final_config = config
     else:
         final_config = redact_configuration(config)
-    config_json = json.dumps(final_config, sort_keys=True)
+    config_json = dump_json(final_config, sort_keys=True)
     return message_info(298, config_json)
 
 
@@ -3045,6 +3754,12 @@ def exit_error_program(index, *args):
     ''' Log error message and exit program. '''
     logging.error(message_error(index, *args))
     logging.error(message_error(698))
+
+    # os._exit() skips atexit, so drain the logging queue here or the
+    # error lines above may never reach stderr.
+
+    if LOG_LISTENER is not None:
+        LOG_LISTENER.stop()
     os._exit(1)
 
 
@@ -3053,9 +3768,64 @@ def exit_silently():
     sys.exit(0)
 
 
+def get_sqs_endpoint_url(queue_url):
+    ''' Extract the scheme://host endpoint from an AWS SQS queue URL. '''
+    parts = urlsplit(queue_url)
+    if not parts.scheme or not parts.netloc:
+        exit_error(750, queue_url)
+    return "{0}://{1}".format(parts.scheme, parts.netloc)
+
+
 def is_db_connection_error(error_text):
     return 'Database Connection Failure' in error_text or 'Database Connection Lost' in error_text
 
+
+def poll_kafka_producer(kafka_producer):
+    ''' Serve a Kafka producer's delivery-report callbacks continuously.
+        Runs on a dedicated daemon thread per producer, so callbacks fire
+        promptly and the produce path never has to poll.
+    '''
+
+    while True:
+        kafka_producer.poll(0.1)
+
+
+def pin_worker_threads(threads):
+    ''' Pin started threads round-robin onto the process's available cores.
+        Keeping each worker on one core reduces scheduler migration and,
+        on multi-socket machines, NUMA interference for the native
+        G2Engine memory the thread touches.
+    '''
+
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+    available_cpus = sorted(os.sched_getaffinity(0))
+    if not available_cpus:
+        return
+    for index, thread in enumerate(threads):
+        native_id = getattr(thread, 'native_id', None)
+        if native_id is None:
+            continue
+        try:
+            os.sched_setaffinity(native_id, {available_cpus[index % len(available_cpus)]})
+        except OSError as err:
+            logging.debug(message_debug(999, err))
+
+
+def lower_thread_priority(threads, niceness=5):
+    ''' Increase the niceness of started threads so they yield to workers. '''
+
+    if not hasattr(os, 'setpriority'):
+        return
+    for thread in threads:
+        native_id = getattr(thread, 'native_id', None)
+        if native_id is None:
+            continue
+        try:
+            os.setpriority(os.PRIO_PROCESS, native_id, niceness)
+        except OSError as err:
+            logging.debug(message_debug(999, err))
+
 # -----------------------------------------------------------------------------
 # Senzing configuration.
 # -----------------------------------------------------------------------------
@@ -3080,12 +3850,17 @@ def get_g2_configuration_dictionary(config):
 
 
 def get_g2_configuration_json(config):
-    ''' Return a JSON string with Senzing configuration. '''
-    result = ""
-    if config.get('engine_configuration_json'):
+    ''' Return a JSON string with Senzing configuration.
+        The string is built once and stashed in config;
+        get_g2_configuration_manager(), get_g2_engine(), and
+        get_g2_product() all ask for the same blob.
+    '''
+    result = config.get('g2_configuration_json')
+    if result is None:
         result = config.get('engine_configuration_json')
-    else:
-        result = json.dumps(get_g2_configuration_dictionary(config))
+        if not result:
+            result = dump_json(get_g2_configuration_dictionary(config))
+        config['g2_configuration_json'] = result
     return result
 
 # -----------------------------------------------------------------------------
@@ -3179,6 +3954,32 @@ def get_g2_product(config, g2_product_name="loader-G2-product"):
     logging.debug(message_debug(951, sys._getframe().f_code.co_name))
     return result
 
+# A single G2Product resource is shared across log_license() calls.
+# Creating and destroying a G2Product involves native allocation and
+# configuration parsing, so it is created lazily and destroyed at exit.
+
+g2_product_cache = None  # pylint: disable=invalid-name
+
+
+def get_g2_product_cached(config, g2_product_name="loader-G2-product"):
+    '''Get a shared G2Product resource, creating it on first use.'''
+    global g2_product_cache  # pylint: disable=global-statement
+    if g2_product_cache is None:
+        g2_product_cache = get_g2_product(config, g2_product_name)
+        atexit.register(destroy_g2_product_cached)
+    return g2_product_cache
+
+
+def destroy_g2_product_cached():
+    '''Garbage collect the shared G2Product resource.'''
+    global g2_product_cache  # pylint: disable=global-statement
+    if g2_product_cache is not None:
+        try:
+            g2_product_cache.destroy()
+        except Exception:
+            pass
+        g2_product_cache = None
+
 # -----------------------------------------------------------------------------
 # Log information.
 # -----------------------------------------------------------------------------
@@ -3187,44 +3988,49 @@ def get_g2_product(config, g2_product_name="loader-G2-product"):
 def log_license(config):
     '''Capture the license and version info in the log.'''
 
-    g2_product = get_g2_product(config)
-    senzing_license = json.loads(g2_product.license())
-    version = json.loads(g2_product.version())
+    g2_product = get_g2_product_cached(config)
+    senzing_license = load_json(g2_product.license())
+    version = load_json(g2_product.version())
+
+    # Collect lines so a single logging.info() call acquires the
+    # logging lock only once.
 
-    logging.info(message_info(160, '-' * 20))
+    lines = [message_info(160, '-' * 20)]
+    expiration_warning = None
     if 'VERSION' in version:
-        logging.info(message_info(161, version['VERSION'], version['BUILD_DATE']))
+        lines.append(message_info(161, version['VERSION'], version['BUILD_DATE']))
     if 'customer' in senzing_license:
-        logging.info(message_info(162, senzing_license['customer']))
+        lines.append(message_info(162, senzing_license['customer']))
     if 'licenseType' in senzing_license:
-        logging.info(message_info(163, senzing_license['licenseType']))
+        lines.append(message_info(163, senzing_license['licenseType']))
     if 'expireDate' in senzing_license:
-        logging.info(message_info(164, senzing_license['expireDate']))
+        lines.append(message_info(164, senzing_license['expireDate']))
+
+        # Calculate days remaining.  The date format is fixed YYYY-MM-DD,
+        # so slicing spares strptime's first-call locale table setup.
+
+        expire_date_text = senzing_license['expireDate']
+        expire_date = datetime.date(int(expire_date_text[0:4]), int(expire_date_text[5:7]), int(expire_date_text[8:10]))
+        remaining_days = (expire_date - datetime.date.today()).days
+        if remaining_days > 0:
+            lines.append(message_info(165, remaining_days))
 
-        # Calculate days remaining.
+            # Issue warning if senzing_license is about to expire.
 
-        expire_date = datetime.datetime.strptime(senzing_license['expireDate'], '%Y-%m-%d')
-        today = datetime.datetime.today()
-        remaining_time = expire_date - today
-        if remaining_time.days > 0:
-            logging.info(message_info(165, remaining_time.days))
             expiration_warning_in_days = config.get('expiration_warning_in_days')
-            if remaining_time.days < expiration_warning_in_days:
-                logging.warning(message_warning(203, remaining_time.days))
+            if remaining_days < expiration_warning_in_days:
+                expiration_warning = message_warning(203, remaining_days)
         else:
-            logging.info(message_info(168, abs(remaining_time.days)))
-
-        # Issue warning if senzing_license is about to expire.
+            lines.append(message_info(168, abs(remaining_days)))
 
     if 'recordLimit' in senzing_license:
-        logging.info(message_info(166, senzing_license['recordLimit']))
+        lines.append(message_info(166, senzing_license['recordLimit']))
     if 'contract' in senzing_license:
-        logging.info(message_info(167, senzing_license['contract']))
-    logging.info(message_info(299, '-' * 49))
-
-    # Garbage collect g2_product.
-
-    g2_product.destroy()
+        lines.append(message_info(167, senzing_license['contract']))
+    lines.append(message_info(299, '-' * 49))
+    logging.info("\n".join(lines))
+    if expiration_warning:
+        logging.warning(expiration_warning)
 
 # -----------------------------------------------------------------------------
 # redo templates
@@ -3236,7 +4042,6 @@ def redo_processor(
         monitor_thread=None,
         options_to_defaults_map=None,
         process_thread=None,
-        read_thread=None,
         subcommand=None,
     ):
 
@@ -3268,13 +4073,7 @@ def redo_processor(
 
     # Pull values from configuration.
 
-    threads_per_read_process = config.get('threads_per_read_process')
     threads_per_process = config.get('threads_per_process')
-    queue_maxsize = config.get('queue_maxsize')
-
-    # Create internal Queue.
-
-    redo_queue = queue.Queue()
 
     # Get the Senzing G2 resources.
 
@@ -3286,19 +4085,7 @@ def redo_processor(
 
     threads = []
 
-    # Add a single thread for reading from Senzing Redo queue and placing on internal queue.
-
-    if read_thread:
-        for i in range(0, threads_per_read_process):
-            thread = read_thread(
-                config=config,
-                g2_engine=g2_engine,
-                redo_queue=redo_queue
-            )
-            thread.name = "Process-0-{0}-{1}".format(thread.__class__.__name__, i)
-            threads.append(thread)
-
-    # Add a number of threads for processing Redo records from internal queue.
+    # Add a number of threads for processing Redo records.
 
     if process_thread:
         for i in range(0, threads_per_process):
@@ -3306,7 +4093,6 @@ def redo_processor(
                 config=config,
                 g2_engine=g2_engine,
                 g2_configuration_manager=g2_configuration_manager,
-                redo_queue=redo_queue,
                 governor=governor
             )
             thread.name = "Process-0-{0}-{1}".format(thread.__class__.__name__, i)
@@ -3330,16 +4116,37 @@ def redo_processor(
     for thread in threads:
         thread.start()
 
+    # Pin worker threads to cores to cut scheduler/NUMA interference.
+
+    pin_worker_threads(threads)
+
     # Start administrative threads for main process.
+    # They are niced so monitoring never competes with workers.
 
     for thread in admin_threads:
         thread.start()
 
+    lower_thread_priority(admin_threads)
+
     # Collect inactive threads from main process.
 
     for thread in threads:
         thread.join()
 
+    # Fold per-thread counters into the configuration for the exit report.
+
+    for thread in threads:
+        for key, value in thread.counters.items():
+            config[key] = config.get(key, 0) + value
+
+    # Wake administrative threads and wait for them to finish so they are
+    # not left mid-period when the Senzing engine is destroyed.
+
+    for thread in admin_threads:
+        thread.stop_event.set()
+    for thread in admin_threads:
+        thread.join()
+
     # Cleanup.
 
     try:
@@ -3374,118 +4181,107 @@ def do_docker_acceptance_test(subcommand, args):
     logging.info(exit_template(config))
 
 
-def do_read_from_azure_queue(subcommand, args):
+def make_do_redo_processor(docstring, **redo_processor_kwargs):
     '''
-    Read Senzing redo records from Azure Queue and send to G2Engine.process().
-    "withinfo" is not returned.
+    Create a do_* subcommand function bound to a specific set of
+    redo_processor() keyword arguments.  The do_* functions are all
+    thin wrappers around redo_processor(); generating them from one
+    template removes the duplicated boilerplate.
     '''
 
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=ProcessReadFromAzureQueueThread,
-        subcommand=subcommand
-    )
+    def do_function(subcommand, args):
+        redo_processor(
+            args=args,
+            subcommand=subcommand,
+            **redo_processor_kwargs
+        )
 
+    do_function.__doc__ = docstring
+    return do_function
 
-def do_read_from_kafka(subcommand, args):
+
+do_read_from_azure_queue = make_do_redo_processor(
     '''
-    Read Senzing redo records from Kafka and send to G2Engine.process().
+    Read Senzing redo records from Azure Queue and send to G2Engine.process().
     "withinfo" is not returned.
-    '''
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=ProcessReadFromAzureQueueThread,
+)
 
-    options_to_defaults_map = {
-        "kafka_redo_bootstrap_server": "kafka_bootstrap_server",
-    }
 
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        options_to_defaults_map=options_to_defaults_map,
-        process_thread=ProcessReadFromKafkaThread,
-        subcommand=subcommand
-    )
+do_read_from_kafka = make_do_redo_processor(
+    '''
+    Read Senzing redo records from Kafka and send to G2Engine.process().
+    "withinfo" is not returned.
+    ''',
+    monitor_thread=MonitorThread,
+    options_to_defaults_map={
+        "kafka_redo_bootstrap_server": "kafka_bootstrap_server",
+    },
+    process_thread=ProcessReadFromKafkaThread,
+)
 
 
-def do_read_from_rabbitmq(subcommand, args):
+do_read_from_rabbitmq = make_do_redo_processor(
     '''
     Read Senzing redo records from RabbitMQ and send to G2Engine.process().
     "withinfo" is not returned.
-    '''
-
-    options_to_defaults_map = {
+    ''',
+    monitor_thread=MonitorThread,
+    options_to_defaults_map={
         "rabbitmq_redo_exchange": "rabbitmq_exchange",
         "rabbitmq_redo_host": "rabbitmq_host",
         "rabbitmq_redo_password": "rabbitmq_password",
         "rabbitmq_redo_username": "rabbitmq_username",
         "rabbitmq_redo_virtual_host": "rabbitmq_virtual_host",
-    }
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        options_to_defaults_map=options_to_defaults_map,
-        process_thread=ProcessReadFromRabbitmqThread,
-        subcommand=subcommand
-    )
+    },
+    process_thread=ProcessReadFromRabbitmqThread,
+)
 
 
-def do_read_from_sqs(subcommand, args):
+do_read_from_sqs = make_do_redo_processor(
     '''
     Read Senzing redo records from RabbitMQ and send to G2Engine.process().
     "withinfo" is not returned.
-    '''
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=ProcessReadFromSqsThread,
-        subcommand=subcommand
-    )
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=ProcessReadFromSqsThread,
+)
 
 
-def do_read_from_azure_queue_withinfo(subcommand, args):
+do_read_from_azure_queue_withinfo = make_do_redo_processor(
     '''
     Read Senzing redo records from Azure queue and send to G2Engine.processWithInfo().
     "withinfo" returned is sent to Azure queue.
-    '''
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=ProcessReadFromAzureQueueWithinfoThread,
-        subcommand=subcommand
-    )
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=ProcessReadFromAzureQueueWithinfoThread,
+)
 
 
-def do_read_from_kafka_withinfo(subcommand, args):
+do_read_from_kafka_withinfo = make_do_redo_processor(
     '''
     Read Senzing redo records from Kafka and send to G2Engine.processWithInfo().
     "withinfo" returned is sent to Kafka.
-    '''
-
-    options_to_defaults_map = {
+    ''',
+    monitor_thread=MonitorThread,
+    options_to_defaults_map={
         "kafka_failure_bootstrap_server": "kafka_bootstrap_server",
         "kafka_info_bootstrap_server": "kafka_bootstrap_server",
         "kafka_redo_bootstrap_server": "kafka_bootstrap_server",
-    }
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        options_to_defaults_map=options_to_defaults_map,
-        process_thread=ProcessReadFromKafkaWithinfoThread,
-        subcommand=subcommand
-    )
+    },
+    process_thread=ProcessReadFromKafkaWithinfoThread,
+)
 
 
-def do_read_from_rabbitmq_withinfo(subcommand, args):
+do_read_from_rabbitmq_withinfo = make_do_redo_processor(
     '''
     Read Senzing redo records from RabbitMQ and send to G2Engine.processWithInfo().
     "withinfo" returned is sent to RabbitMQ.
-    '''
-
-    options_to_defaults_map = {
+    ''',
+    monitor_thread=MonitorThread,
+    options_to_defaults_map={
         "rabbitmq_failure_exchange": "rabbitmq_exchange",
         "rabbitmq_failure_host": "rabbitmq_host",
         "rabbitmq_failure_password": "rabbitmq_password",
@@ -3501,89 +4297,62 @@ def do_read_from_rabbitmq_withinfo(subcommand, args):
         "rabbitmq_redo_password": "rabbitmq_password",
         "rabbitmq_redo_username": "rabbitmq_username",
         "rabbitmq_redo_virtual_host": "rabbitmq_virtual_host",
-    }
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        options_to_defaults_map=options_to_defaults_map,
-        process_thread=ProcessReadFromRabbitmqWithinfoThread,
-        subcommand=subcommand
-    )
+    },
+    process_thread=ProcessReadFromRabbitmqWithinfoThread,
+)
 
 
-def do_read_from_sqs_withinfo(subcommand, args):
+do_read_from_sqs_withinfo = make_do_redo_processor(
     '''
     Read Senzing redo records from AWS SQS and send to G2Engine.processWithInfo().
     "withinfo" returned is sent to AWS SQS.
-    '''
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=ProcessReadFromSqsWithinfoThread,
-        subcommand=subcommand
-    )
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=ProcessReadFromSqsWithinfoThread,
+)
 
 
-def do_redo(subcommand, args):
+do_redo = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to G2Engine.process().
     No external queues are used.  "withinfo" is not returned.
-    '''
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=ProcessRedoThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=ProcessRedoThread,
+)
 
 
-def do_redo_withinfo_azure_queue(subcommand, args):
+do_redo_withinfo_azure_queue = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to G2Engine.processWithInfo().
     No external queues are used.  "withinfo" returned is sent to Azure queue.
-    '''
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=ProcessRedoWithinfoAzureQueueThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=ProcessRedoWithinfoAzureQueueThread,
+)
 
 
-def do_redo_withinfo_kafka(subcommand, args):
+do_redo_withinfo_kafka = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to G2Engine.processWithInfo().
     No external queues are used.  "withinfo" returned is sent to kafka.
-    '''
-
-    options_to_defaults_map = {
+    ''',
+    monitor_thread=MonitorThread,
+    options_to_defaults_map={
         "kafka_failure_bootstrap_server": "kafka_bootstrap_server",
         "kafka_info_bootstrap_server": "kafka_bootstrap_server",
-    }
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        options_to_defaults_map=options_to_defaults_map,
-        process_thread=ProcessRedoWithinfoKafkaThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
+    },
+    process_thread=ProcessRedoWithinfoKafkaThread,
+)
 
 
-def do_redo_withinfo_rabbitmq(subcommand, args):
+do_redo_withinfo_rabbitmq = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to G2Engine.processWithInfo().
     No external queues are used.  "withinfo" returned is sent to RabbitMQ.
-    '''
-
-    options_to_defaults_map = {
+    ''',
+    monitor_thread=MonitorThread,
+    options_to_defaults_map={
         "rabbitmq_failure_exchange": "rabbitmq_exchange",
         "rabbitmq_failure_host": "rabbitmq_host",
         "rabbitmq_failure_password": "rabbitmq_password",
@@ -3594,31 +4363,19 @@ def do_redo_withinfo_rabbitmq(subcommand, args):
         "rabbitmq_info_password": "rabbitmq_password",
         "rabbitmq_info_username": "rabbitmq_username",
         "rabbitmq_info_virtual_host": "rabbitmq_virtual_host",
-    }
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        options_to_defaults_map=options_to_defaults_map,
-        process_thread=ProcessRedoWithinfoRabbitmqThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
+    },
+    process_thread=ProcessRedoWithinfoRabbitmqThread,
+)
 
 
-def do_redo_withinfo_sqs(subcommand, args):
+do_redo_withinfo_sqs = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to G2Engine.processWithInfo().
     No external queues are used.  "withinfo" returned is sent to RabbitMQ.
-    '''
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=ProcessRedoWithinfoSqsThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=ProcessRedoWithinfoSqsThread,
+)
 
 
 def do_sleep(subcommand, args):
@@ -3643,88 +4400,63 @@ def do_sleep(subcommand, args):
         time.sleep(sleep_time_in_seconds)
 
     else:
-        sleep_time_in_seconds = 3600
+        logging.info(message_info(295))
         while True:
-            logging.info(message_info(295))
-            time.sleep(sleep_time_in_seconds)
+            signal.pause()
 
     # Epilog.
 
     logging.info(exit_template(config))
 
 
-def do_write_to_azure_queue(subcommand, args):
+do_write_to_azure_queue = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to Azure Queue.
     No g2_engine processing is done.
-    '''
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=QueueRedoRecordsAzureQueueThread,
+)
 
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=QueueRedoRecordsAzureQueueThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
 
-
-def do_write_to_kafka(subcommand, args):
+do_write_to_kafka = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to Kafka.
     No g2_engine processing is done.
-    '''
-
-    options_to_defaults_map = {
+    ''',
+    monitor_thread=MonitorThread,
+    options_to_defaults_map={
         "kafka_redo_bootstrap_server": "kafka_bootstrap_server",
-    }
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        options_to_defaults_map=options_to_defaults_map,
-        process_thread=QueueRedoRecordsKafkaThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
+    },
+    process_thread=QueueRedoRecordsKafkaThread,
+)
 
 
-def do_write_to_rabbitmq(subcommand, args):
+do_write_to_rabbitmq = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to RabbitMQ.
     No g2_engine processing is done.
-    '''
-
-    options_to_defaults_map = {
+    ''',
+    monitor_thread=MonitorThread,
+    options_to_defaults_map={
         "rabbitmq_redo_exchange": "rabbitmq_exchange",
         "rabbitmq_redo_host": "rabbitmq_host",
         "rabbitmq_redo_password": "rabbitmq_password",
         "rabbitmq_redo_username": "rabbitmq_username",
         "rabbitmq_redo_virtual_host": "rabbitmq_virtual_host",
-    }
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        options_to_defaults_map=options_to_defaults_map,
-        process_thread=QueueRedoRecordsRabbitmqThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
+    },
+    process_thread=QueueRedoRecordsRabbitmqThread,
+)
 
 
-def do_write_to_sqs(subcommand, args):
+do_write_to_sqs = make_do_redo_processor(
     '''
     Read Senzing redo records from Senzing SDK and send to AWS SQS.
     No g2_engine processing is done.
-    '''
-
-    redo_processor(
-        args=args,
-        monitor_thread=MonitorThread,
-        process_thread=QueueRedoRecordsSqsThread,
-        read_thread=QueueRedoRecordsInternalThread,
-        subcommand=subcommand
-    )
+    ''',
+    monitor_thread=MonitorThread,
+    process_thread=QueueRedoRecordsSqsThread,
+)
 
 
 def do_version(subcommand, args):
@@ -3733,6 +4465,11 @@ def do_version(subcommand, args):
     logging.info(message_info(294, __version__, __updated__))
     logging.debug(message_debug(902, subcommand, args))
 
+# Map subcommand names to their do_* functions, precomputed once at
+# import so dispatch is a single dictionary lookup.
+
+SUBCOMMAND_DISPATCH = {name[3:].replace('_', '-'): function for name, function in globals().items() if name.startswith('do_') and callable(function)}
+
 # -----------------------------------------------------------------------------
 # Main
 # -----------------------------------------------------------------------------
@@ -3754,7 +4491,26 @@ if __name__ == "__main__":
 
     LOG_LEVEL_PARAMETER = os.getenv("SENZING_LOG_LEVEL", "info").lower()
     LOG_LEVEL = LOG_LEVEL_MAP.get(LOG_LEVEL_PARAMETER, logging.INFO)
-    logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
+
+    # Decouple threads from the stderr write: records are enqueued onto a
+    # SimpleQueue and one listener thread formats and writes them, so
+    # workers never contend on the stream handler's I/O lock.
+
+    LOG_QUEUE = queue.SimpleQueue()
+    LOG_QUEUE_HANDLER = logging.handlers.QueueHandler(LOG_QUEUE)
+    LOG_QUEUE_HANDLER.setFormatter(logging.Formatter(LOG_FORMAT))
+    logging.basicConfig(handlers=[LOG_QUEUE_HANDLER], level=LOG_LEVEL)
+    LOG_LISTENER = logging.handlers.QueueListener(LOG_QUEUE, logging.StreamHandler())  # pylint: disable=invalid-name
+    LOG_LISTENER.start()
+    atexit.register(LOG_LISTENER.stop)
+
+    # LOG_FORMAT uses only asctime and message, so skip collecting
+    # thread/process information when each LogRecord is created.
+
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     logging.debug(message_debug(998))
 
     # Trap signals temporarily until args are parsed.
@@ -3799,17 +4555,12 @@ if __name__ == "__main__":
     signal.signal(signal.SIGINT, SIGNAL_HANDLER)
     signal.signal(signal.SIGTERM, SIGNAL_HANDLER)
 
-    # Transform subcommand from CLI parameter to function name string.
+    # Look up the subcommand's function in the precomputed dispatch table.
 
-    SUBCOMMAND_FUNCTION_NAME = "do_{0}".format(SUBCOMMAND.replace('-', '_'))
-
-    # Test to see if function exists in the code.
-
-    if SUBCOMMAND_FUNCTION_NAME not in globals():
+    SUBCOMMAND_FUNCTION = SUBCOMMAND_DISPATCH.get(SUBCOMMAND)
+    if SUBCOMMAND_FUNCTION is None:
         logging.warning(message_warning(696, SUBCOMMAND))
         PARSER.print_help()
         exit_silently()
 
-    # Tricky code for calling function based on string.
-
-    globals()[SUBCOMMAND_FUNCTION_NAME](SUBCOMMAND, ARGS)
+    SUBCOMMAND_FUNCTION(SUBCOMMAND, ARGS)